@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import html
 import json
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import attrgetter, itemgetter, sub
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -19,44 +25,78 @@ from .excel_store import (
     read_task_events,
     read_tasks,
 )
-from .llm_ollama import detect_ollama, ollama_narrative_summary
+from .llm_ollama import OLLAMA_PROBE_CACHE, detect_ollama, ollama_narrative_summary
+from .paths import PATH_TYPE
 
 DAILY_SHEET = "Daily_Summaries"
 WEEKLY_SHEET = "Weekly_Summaries"
 MISSED_SHEET = "Missed_Checkins"
 TASK_HISTORY_SHEET = "Task_History"
+ANALYTICS_WORKBOOK = "analytics.xlsx"
+ANALYTICS_CACHE = "analytics_cache.json"
+ANALYTICS_LOCK = "analytics.lock"
+# Earlier versions wrote these sheets into time_log.xlsx; they now live in analytics.xlsx.
+LEGACY_ANALYTICS_SHEETS = (DAILY_SHEET, WEEKLY_SHEET, MISSED_SHEET, TASK_HISTORY_SHEET)
+LEGACY_SHEETS_MARKER = "legacy_analytics_sheets_removed"
 
+# Below these, the heuristic narrative says as much as the LLM would.
+MIN_BLOCKS_FOR_LLM = 4
+DOMINANCE_SKIP_RATIO = 0.9
 
-def _log_info(cfg: Config, message: str) -> None:
-    try:
-        cfg.resolve_paths()
-        log_path = cfg.state_dir / "logs" / "app.log"
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now().isoformat(timespec="seconds")
-        with log_path.open("a", encoding="utf-8") as fh:
-            fh.write(f"[{ts}] {message}\n")
-    except Exception:
-        pass
+# One shared encoder bound once; every summary row serializes several small payloads.
+_dumps = json.JSONEncoder().encode
 
 
-def _log_warn(cfg: Config, message: str) -> None:
-    """Lightweight logger writing to state_dir/app.log without failing analytics."""
-    try:
-        cfg.resolve_paths()
-        log_path = cfg.state_dir / "logs" / "app.log"
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now().isoformat(timespec="seconds")
-        with log_path.open("a", encoding="utf-8") as fh:
-            fh.write(f"[{ts}] {message}\n")
-    except Exception:
-        pass
+class _RunLog:
+    """Lightweight logger writing to state_dir/logs/app.log without failing analytics.
+
+    The file is opened once per analytics run and buffered, instead of a resolve/mkdir/open/close per line.
+    """
+
+    def __init__(self, cfg: Config) -> None:
+        self._fh = None
+        try:
+            log_path = cfg.state_dir / "logs" / "app.log"
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = log_path.open("a", encoding="utf-8", buffering=64 * 1024)
+        except Exception:
+            pass
+
+    def __call__(self, message: str) -> None:
+        if self._fh is None:
+            return
+        try:
+            ts = datetime.now().isoformat(timespec="seconds")
+            self._fh.write(f"[{ts}] {message}\n")
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
+
+
+_CFG_PATH_ATTRS = (
+    "state_dir",
+    "data_dir",
+    "log_path",
+    "report_path",
+    "state_path",
+    "learned_rules_path",
+    "config_path",
+    "log_lock_path",
+)
 
 
 def _coerce_cfg_paths(cfg: "Config") -> "Config":
     """Ensure any string paths on the config are converted to Path objects."""
-    for name in ["state_dir", "data_dir", "log_path", "report_path", "state_path", "learned_rules_path", "config_path", "log_lock_path"]:
+    for name in _CFG_PATH_ATTRS:
         value = getattr(cfg, name, None)
-        if value is None:
+        if value is None or type(value) is PATH_TYPE:
             continue
         if not isinstance(value, Path):
             try:
@@ -118,7 +158,12 @@ def parse_timestamp(value: object) -> Optional[datetime]:
         return value
     if isinstance(value, date):
         return datetime.combine(value, datetime.min.time())
-    s = str(value).strip()
+    return _parse_ts_str(str(value).strip())
+
+
+@lru_cache(maxsize=65536)
+def _parse_ts_str(s: str) -> Optional[datetime]:
+    # Cached by raw string: logs repeat the same stamps across entries and task events.
     if not s:
         return None
     if s.endswith("Z"):
@@ -150,21 +195,20 @@ class Block:
     activity: str
     energy: int
     focus: int
+    # Computed once; every day/week/category aggregation reads it.
+    hours: float = field(init=False)
 
-    @property
-    def hours(self) -> float:
-        return max(0.0, (self.end - self.start).total_seconds() / 3600.0)
+    def __post_init__(self) -> None:
+        self.hours = max(0.0, (self.end - self.start).total_seconds() / 3600.0)
 
 
 def entries_to_blocks(entries: List[dict], cfg: Config) -> Tuple[List[Block], int]:
     """Convert check-ins to estimated time blocks.
 
-    Heuristic: each entry represents the preceding entry_hours unless a large gap
-    suggests a shorter block ending at the next check-in.
+    Each entry represents the preceding entry_hours, ending at its own timestamp.
     """
     rules = cfg.analytics_rules
-    entry_hours = max(0.25, float(rules.entry_hours))
-    gap_break_hours = max(entry_hours, float(rules.gap_break_hours))
+    entry_delta = timedelta(hours=max(0.25, float(rules.entry_hours)))
 
     parsed: List[Tuple[datetime, dict]] = []
     parse_failures = 0
@@ -174,48 +218,64 @@ def entries_to_blocks(entries: List[dict], cfg: Config) -> Tuple[List[Block], in
             parsed.append((ts, row))
         else:
             parse_failures += 1
-    parsed.sort(key=lambda x: x[0])
+    parsed.sort(key=itemgetter(0))
+
+    # Entries are sorted, so the next check-in never precedes ts and the block always ends at ts;
+    # no neighbour/gap arithmetic is needed per row.
+    blocks = [
+        Block(
+            start=ts - entry_delta,
+            end=ts,
+            category=str(row.get("category") or "Other"),
+            activity=str(row.get("activity") or ""),
+            energy=_to_int(row.get("energy"), 3),
+            focus=_to_int(row.get("focus"), 3),
+        )
+        for ts, row in parsed
+    ]
+    return blocks, parse_failures
 
-    blocks: List[Block] = []
-    for idx, (ts, row) in enumerate(parsed):
-        next_ts = parsed[idx + 1][0] if idx + 1 < len(parsed) else None
-        category = str(row.get("category") or "Other")
-        activity = str(row.get("activity") or "")
-        energy = _to_int(row.get("energy"), 3)
-        focus = _to_int(row.get("focus"), 3)
 
-        start = ts - timedelta(hours=entry_hours)
-        end = ts
+def _block_day(block: Block) -> date:
+    return block.end.date()
 
-        if next_ts:
-            gap_hours = max(0.0, (next_ts - ts).total_seconds() / 3600.0)
-            if gap_hours >= gap_break_hours:
-                end = ts
-            else:
-                # Cap the block to avoid overlapping too far into the next entry.
-                end = min(ts, next_ts)
 
-        if end <= start:
-            start = end - timedelta(hours=entry_hours)
+def _group_blocks_by_day(blocks: Iterable[Block]) -> Dict[date, List[Block]]:
+    """Group blocks by end date.
 
-        blocks.append(Block(start=start, end=end, category=category, activity=activity, energy=energy, focus=focus))
+    entries_to_blocks returns blocks sorted by end, so each day arrives as one contiguous run and is
+    sliced off in a single groupby step instead of a dict insert per block.
+    """
+    grouped: Dict[date, List[Block]] = {}
+    for day, run in groupby(blocks, key=_block_day):
+        existing = grouped.get(day)
+        if existing is None:
+            grouped[day] = list(run)
+        else:
+            existing.extend(run)  # unsorted input still groups correctly
+    return grouped
 
-    return blocks, parse_failures
 
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
 
-def _group_blocks_by_day(blocks: Iterable[Block]) -> Dict[date, List[Block]]:
+
+def _group_days_by_week(daily_blocks: Dict[date, List[Block]]) -> Dict[date, List[Block]]:
+    """Regroup already day-grouped blocks by week without touching each block's timestamp again."""
     grouped: Dict[date, List[Block]] = defaultdict(list)
-    for block in blocks:
-        grouped[block.end.date()].append(block)
+    for day in sorted(daily_blocks):
+        grouped[_week_start(day)].extend(daily_blocks[day])
     return dict(grouped)
 
 
-def _group_blocks_by_week(blocks: Iterable[Block]) -> Dict[date, List[Block]]:
-    grouped: Dict[date, List[Block]] = defaultdict(list)
-    for block in blocks:
-        week_start = block.end.date() - timedelta(days=block.end.weekday())
-        grouped[week_start].append(block)
-    return dict(grouped)
+def _rollup_weekly_hours(daily_cat_hours: Dict[date, Dict[str, float]]) -> Dict[date, Dict[str, float]]:
+    """Sum per-day category totals into per-week totals (early aggregation)."""
+    weekly: Dict[date, Dict[str, float]] = {}
+    for day in sorted(daily_cat_hours):
+        totals = weekly.setdefault(_week_start(day), {})
+        for cat, hours in daily_cat_hours[day].items():
+            totals[cat] = totals.get(cat, 0.0) + hours
+    return weekly
 
 
 def _hours_per_category(blocks: Iterable[Block]) -> Dict[str, float]:
@@ -226,26 +286,27 @@ def _hours_per_category(blocks: Iterable[Block]) -> Dict[str, float]:
 
 
 def _top_categories(cat_hours: Dict[str, float], n: int = 3) -> List[Tuple[str, float]]:
-    return sorted(cat_hours.items(), key=lambda kv: kv[1], reverse=True)[:n]
+    return heapq.nlargest(n, cat_hours.items(), key=itemgetter(1))
 
 
 def _most_common_activities(blocks: Iterable[Block], n: int = 5) -> List[Tuple[str, int]]:
-    counter = Counter(block.activity.strip() for block in blocks if block.activity.strip())
+    # Strip once per block and let Counter consume a C-level map/filter chain.
+    counter = Counter(filter(None, map(str.strip, map(attrgetter("activity"), blocks))))
     return counter.most_common(n)
 
 
-def _time_sinks(cat_hours: Dict[str, float]) -> List[Tuple[str, float]]:
-    return sorted(cat_hours.items(), key=lambda kv: kv[1], reverse=True)[:5]
-
-
-def _heuristic_narrative(day_blocks: List[Block], cat_hours: Dict[str, float]) -> Tuple[str, List[str]]:
-    top = _top_categories(cat_hours, n=3)
+def _heuristic_narrative(day_blocks: List[Block], top: List[Tuple[str, float]]) -> Tuple[str, List[str]]:
     if not top:
         return ("No check-ins recorded.", ["Set a shorter interval to build the habit.", "Use 'Log now' after long breaks.", "Add categories to the Lookup sheet."])
 
     top_text = ", ".join(f"{cat} ({hours:.1f}h)" for cat, hours in top)
-    avg_focus = sum(b.focus for b in day_blocks) / max(1, len(day_blocks))
-    avg_energy = sum(b.energy for b in day_blocks) / max(1, len(day_blocks))
+    focus_total = 0
+    energy_total = 0
+    for b in day_blocks:
+        focus_total += b.focus
+        energy_total += b.energy
+    avg_focus = focus_total / max(1, len(day_blocks))
+    avg_energy = energy_total / max(1, len(day_blocks))
 
     narrative = (
         f"Most of the day went to {top_text}. "
@@ -259,13 +320,26 @@ def _heuristic_narrative(day_blocks: List[Block], cat_hours: Dict[str, float]) -
     return narrative, suggestions
 
 
-def _maybe_llm_summary(cfg: Config, summary_input: str) -> Optional[Tuple[str, List[str]]]:
+def _llm_ready(cfg: Config) -> bool:
+    """Probe Ollama once per analytics run; the result holds for every day/week summary."""
     if not cfg.llm_enabled:
-        return None
-    status = detect_ollama()
-    if not status.installed:
-        return None
-    if cfg.llm_model not in status.models:
+        return False
+    status = detect_ollama(cfg.state_dir / OLLAMA_PROBE_CACHE)
+    return bool(status.installed and cfg.llm_model in status.models)
+
+
+def _worth_llm_summary(blocks: List[Block], top: List[Tuple[str, float]], cat_hours: Dict[str, float]) -> bool:
+    """Skip the (slow) LLM for sparse days or days spent almost entirely in one category."""
+    if len(blocks) < MIN_BLOCKS_FOR_LLM:
+        return False
+    total = sum(cat_hours.values())
+    if top and total > 0 and top[0][1] / total > DOMINANCE_SKIP_RATIO:
+        return False
+    return True
+
+
+def _maybe_llm_summary(cfg: Config, summary_input: str, *, ready: bool) -> Optional[Tuple[str, List[str]]]:
+    if not ready:
         return None
 
     result = ollama_narrative_summary(cfg.llm_model, cfg.llm_timeout_seconds, summary_input)
@@ -292,6 +366,20 @@ def _build_summary_input(day: date, blocks: List[Block], cat_hours: Dict[str, fl
     return "\n".join(parts)
 
 
+def _day_gap_stats(stamps: List[datetime]) -> List[Tuple[date, datetime, datetime, int, timedelta]]:
+    """Per-day (day, first, last, count, largest_gap) over sorted stamps.
+
+    Each day's slice is reduced with builtin max()/map() so the pairwise gap loop runs in C.
+    """
+    stats: List[Tuple[date, datetime, datetime, int, timedelta]] = []
+    zero = timedelta(0)
+    for day, group in groupby(stamps, key=datetime.date):
+        day_stamps = list(group)
+        largest = max(map(sub, day_stamps[1:], day_stamps), default=zero)
+        stats.append((day, day_stamps[0], day_stamps[-1], len(day_stamps), largest))
+    return stats
+
+
 def _estimate_missed_checkins(entries: List[dict], cfg: Config) -> List[dict]:
     interval_hours = max(1.0 / 60.0, cfg.interval_minutes / 60.0)
     gap_break_hours = max(interval_hours, float(cfg.analytics_rules.gap_break_hours))
@@ -305,21 +393,11 @@ def _estimate_missed_checkins(entries: List[dict], cfg: Config) -> List[dict]:
     if len(parsed) < 2:
         return []
 
-    by_day: Dict[date, List[datetime]] = defaultdict(list)
-    for ts in parsed:
-        by_day[ts.date()].append(ts)
-
     reports: List[dict] = []
-    for day, stamps in sorted(by_day.items()):
-        stamps.sort()
-        span_hours = max(1.0, (stamps[-1] - stamps[0]).total_seconds() / 3600.0)
+    for day, first, last, actual, largest_gap_delta in _day_gap_stats(parsed):
+        span_hours = max(1.0, (last - first).total_seconds() / 3600.0)
         expected = int(span_hours // interval_hours) + 1
-        actual = len(stamps)
-
-        largest_gap = 0.0
-        for a, b in zip(stamps, stamps[1:]):
-            gap = (b - a).total_seconds() / 3600.0
-            largest_gap = max(largest_gap, gap)
+        largest_gap = largest_gap_delta.total_seconds() / 3600.0
 
         missed = max(0, expected - actual)
         if largest_gap >= gap_break_hours or missed > 0:
@@ -336,9 +414,50 @@ def _estimate_missed_checkins(entries: List[dict], cfg: Config) -> List[dict]:
     return reports
 
 
-def _upsert_sheet(wb: Workbook, name: str, headers: List[str], rows: List[List[object]]) -> None:
-    if name in wb.sheetnames:
-        del wb[name]
+def _blocks_digest(blocks: List[Block], settings_key: str) -> str:
+    """Fingerprint the blocks behind a summary row so unchanged days/weeks can reuse it."""
+    h = hashlib.blake2b(settings_key.encode("utf-8"), digest_size=16)
+    for b in blocks:
+        h.update(repr((b.start, b.end, b.category, b.activity, b.energy, b.focus)).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_summary_cache(path: Path) -> Dict[str, Dict[str, list]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return {"daily": dict(data.get("daily") or {}), "weekly": dict(data.get("weekly") or {})}
+    except Exception:
+        return {"daily": {}, "weekly": {}}
+
+
+def _save_summary_cache(path: Path, cache: Dict[str, Dict[str, list]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(_dumps(cache), encoding="utf-8")
+
+
+def _drop_legacy_analytics_sheets(cfg: Config, log: _RunLog) -> None:
+    """Remove the stale summary sheets an older version left in time_log.xlsx (once, tracked by a marker)."""
+    marker = cfg.state_dir / LEGACY_SHEETS_MARKER
+    if marker.exists() or not Path(cfg.log_path).exists():
+        return
+    lock_path = cfg.log_lock_path or cfg.log_path.with_suffix(cfg.log_path.suffix + ".lock")
+    try:
+        with file_lock(lock_path, timeout_seconds=5.0):
+            wb = load_or_create_workbook(cfg.log_path)
+            stale = [name for name in LEGACY_ANALYTICS_SHEETS if name in wb.sheetnames]
+            if stale:
+                for name in stale:
+                    del wb[name]
+                atomic_save_workbook(wb, cfg.log_path)
+                log(f"Removed legacy analytics sheets from {Path(cfg.log_path).name}: {stale}")
+        marker.touch()
+    except Exception as exc:
+        # Retried on the next run; the marker is only written once the log is clean.
+        log(f"Legacy analytics sheet cleanup skipped: {exc}")
+
+
+def _write_sheet(wb: Workbook, name: str, headers: List[str], rows: List[List[object]]) -> None:
+    """Stream rows into a write-only sheet; cells are flushed as they are appended."""
     ws = wb.create_sheet(title=name)
     ws.append(headers)
     for row in rows:
@@ -355,6 +474,14 @@ def write_analytics(cfg: Config) -> tuple[Path, datetime, List[dict]]:
     cfg.resolve_paths()
     assert cfg.log_path is not None
 
+    log = _RunLog(cfg)
+    try:
+        return _write_analytics(cfg, log)
+    finally:
+        log.close()
+
+
+def _write_analytics(cfg: Config, log: _RunLog) -> tuple[Path, datetime, List[dict]]:
     updated_at = datetime.now()
 
     warnings: List[str] = []
@@ -367,19 +494,19 @@ def write_analytics(cfg: Config) -> tuple[Path, datetime, List[dict]]:
         except (TimeoutError, PermissionError) as exc:
             msg = f"{label} unavailable: {exc}"
             warnings.append(msg)
-            _log_warn(cfg, msg)
+            log(msg)
             return fallback
         except Exception as exc:
             msg = f"{label} failed: {exc}"
             warnings.append(msg)
-            _log_warn(cfg, msg)
+            log(msg)
             return fallback
 
     entries = _safe_read("entries", lambda: read_entries(cfg.log_path, lock_path=cfg.log_lock_path), [])
     total_entries = len(entries)
     detected_headers = list(entries[0].keys()) if entries else list(getattr(read_entries, "last_headers", []))
     if not detected_headers:
-        _log_warn(cfg, "Entries header row not found; analytics skipped.")
+        log("Entries header row not found; analytics skipped.")
         write_html_report(
             report_path,
             [],
@@ -395,65 +522,99 @@ def write_analytics(cfg: Config) -> tuple[Path, datetime, List[dict]]:
         )
         cfg.report_updated_at = updated_at.isoformat(timespec="seconds")
         return report_path, updated_at, entries
-    _log_info(
-        cfg,
+    log(
         f"write_analytics log_path={Path(cfg.log_path).resolve()} report_path={report_path.resolve()} entries={total_entries}",
     )
-    _log_info(cfg, f"entries headers={detected_headers}")
+    log(f"entries headers={detected_headers}")
     task_events = _safe_read("task events", lambda: read_task_events(cfg.log_path, lock_path=cfg.log_lock_path), [])
     tasks = _safe_read("tasks", lambda: read_tasks(cfg.log_path, status_filter=None, lock_path=cfg.log_lock_path), [])
     blocks, parse_failures = entries_to_blocks(entries, cfg)
 
     daily_blocks = _group_blocks_by_day(blocks)
-    weekly_blocks = _group_blocks_by_week(blocks)
+    daily_cat_hours = {day: _hours_per_category(day_list) for day, day_list in daily_blocks.items()}
+    weekly_blocks = _group_days_by_week(daily_blocks)
+    weekly_cat_hours = _rollup_weekly_hours(daily_cat_hours)
     missed_reports = _estimate_missed_checkins(entries, cfg)
 
+    llm_ready = _llm_ready(cfg)
+
+    # Historical days rarely change: reuse a summary row (and its LLM narrative) while its
+    # blocks hash the same, and only rebuild days/weeks whose check-ins changed.
+    cache_path = cfg.state_dir / ANALYTICS_CACHE
+    cached = _load_summary_cache(cache_path)
+    fresh_cache: Dict[str, Dict[str, list]] = {"daily": {}, "weekly": {}}
+    settings_key = f"{cfg.analytics_rules.entry_hours}|{llm_ready}|{cfg.llm_model}"
+
     daily_rows: List[List[object]] = []
     today = datetime.now().date()
     today_entry_count = 0
     for day, day_list in sorted(daily_blocks.items()):
-        cat_hours = _hours_per_category(day_list)
+        if day == today:
+            today_entry_count = len(day_list)
+
+        day_key = day.isoformat()
+        digest = _blocks_digest(day_list, settings_key)
+        hit = cached["daily"].get(day_key)
+        if hit and hit[0] == digest:
+            daily_rows.append(hit[1])
+            fresh_cache["daily"][day_key] = hit
+            continue
+
+        cat_hours = daily_cat_hours[day]
         top = _top_categories(cat_hours)
         top_text = ", ".join(f"{c}:{h:.1f}" for c, h in top)
-        summary_input = _build_summary_input(day, day_list, cat_hours)
-        llm_summary = _maybe_llm_summary(cfg, summary_input)
+        llm_summary = None
+        llm_attempted = llm_ready and _worth_llm_summary(day_list, top, cat_hours)
+        if llm_attempted:
+            summary_input = _build_summary_input(day, day_list, cat_hours)
+            llm_summary = _maybe_llm_summary(cfg, summary_input, ready=True)
         if llm_summary:
             narrative, suggestions = llm_summary
         else:
-            narrative, suggestions = _heuristic_narrative(day_list, cat_hours)
-
-        if day == today:
-            today_entry_count = len(day_list)
-
-        daily_rows.append(
-            [
-                day.isoformat(),
-                round(sum(cat_hours.values()), 2),
-                top_text,
-                json.dumps(cat_hours),
-                narrative,
-                json.dumps(suggestions),
-            ]
-        )
+            narrative, suggestions = _heuristic_narrative(day_list, top)
+
+        row = [
+            day_key,
+            round(sum(cat_hours.values()), 2),
+            top_text,
+            _dumps(cat_hours),
+            narrative,
+            _dumps(suggestions),
+        ]
+        daily_rows.append(row)
+        # A heuristic stand-in for a failed LLM call is not cached, so the next run retries the LLM.
+        if llm_summary or not llm_attempted:
+            fresh_cache["daily"][day_key] = [digest, row]
 
     weekly_rows: List[List[object]] = []
     for week_start, week_list in sorted(weekly_blocks.items()):
+        week_key = week_start.isoformat()
+        digest = _blocks_digest(week_list, settings_key)
+        hit = cached["weekly"].get(week_key)
+        if hit and hit[0] == digest:
+            weekly_rows.append(hit[1])
+            fresh_cache["weekly"][week_key] = hit
+            continue
+
         week_end = week_start + timedelta(days=6)
-        cat_hours = _hours_per_category(week_list)
+        cat_hours = weekly_cat_hours[week_start]
+        # Time sinks are the same five largest categories, so one selection serves both columns.
         top = _top_categories(cat_hours, n=5)
         top_text = ", ".join(f"{c}:{h:.1f}" for c, h in top)
         frequent = _most_common_activities(week_list, n=7)
         frequent_text = ", ".join(f"{a} ({n})" for a, n in frequent)
-        sinks = _time_sinks(cat_hours)
-        sinks_text = ", ".join(f"{c}:{h:.1f}" for c, h in sinks)
-
-        summary_input = (
-            f"Week: {week_start.isoformat()} to {week_end.isoformat()}\n"
-            f"Category hours: {cat_hours}\n"
-            f"Frequent activities: {frequent_text}\n"
-            f"Time sinks: {sinks_text}\n"
-        )
-        llm_summary = _maybe_llm_summary(cfg, summary_input)
+        sinks_text = top_text
+
+        llm_summary = None
+        llm_attempted = llm_ready and len(week_list) >= MIN_BLOCKS_FOR_LLM
+        if llm_attempted:
+            summary_input = (
+                f"Week: {week_start.isoformat()} to {week_end.isoformat()}\n"
+                f"Category hours: {cat_hours}\n"
+                f"Frequent activities: {frequent_text}\n"
+                f"Time sinks: {sinks_text}\n"
+            )
+            llm_summary = _maybe_llm_summary(cfg, summary_input, ready=True)
         if llm_summary:
             narrative, suggestions = llm_summary
         else:
@@ -465,19 +626,25 @@ def write_analytics(cfg: Config) -> tuple[Path, datetime, List[dict]]:
             ]
 
         pie_data = [{"category": c, "hours": round(h, 2)} for c, h in sorted(cat_hours.items(), key=lambda kv: kv[1], reverse=True)]
-        weekly_rows.append(
-            [
-                week_start.isoformat(),
-                week_end.isoformat(),
-                round(sum(cat_hours.values()), 2),
-                top_text,
-                frequent_text,
-                sinks_text,
-                json.dumps(pie_data),
-                narrative,
-                json.dumps(suggestions),
-            ]
-        )
+        row = [
+            week_key,
+            week_end.isoformat(),
+            round(sum(cat_hours.values()), 2),
+            top_text,
+            frequent_text,
+            sinks_text,
+            _dumps(pie_data),
+            narrative,
+            _dumps(suggestions),
+        ]
+        weekly_rows.append(row)
+        if llm_summary or not llm_attempted:
+            fresh_cache["weekly"][week_key] = [digest, row]
+
+    try:
+        _save_summary_cache(cache_path, fresh_cache)
+    except Exception as exc:
+        log(f"Analytics cache write failed: {exc}")
 
     missed_rows = [
         [r["date"], r["expected"], r["actual"], r["missed"], r["largest_gap_hours"]] for r in missed_reports
@@ -499,7 +666,7 @@ def write_analytics(cfg: Config) -> tuple[Path, datetime, List[dict]]:
 
     if parse_failures:
         warnings.append(f"Warning: {parse_failures} entries had unparseable timestamps and were skipped.")
-        _log_warn(cfg, warnings[-1])
+        log(warnings[-1])
     try:
         write_html_report(
             report_path,
@@ -515,19 +682,23 @@ def write_analytics(cfg: Config) -> tuple[Path, datetime, List[dict]]:
             warnings=warnings,
         )
     except Exception as exc:
-        _log_warn(cfg, f"write_html_report failed: {exc}")
+        log(f"write_html_report failed: {exc}")
     cfg.report_updated_at = updated_at.isoformat(timespec="seconds")
-    lock_path = cfg.log_lock_path or cfg.log_path.with_suffix(cfg.log_path.suffix + ".lock")
+    _drop_legacy_analytics_sheets(cfg, log)
+    analytics_path = cfg.data_dir / ANALYTICS_WORKBOOK
+    # The output workbook has its own lock: check-ins writing time_log.xlsx never wait on this save.
+    lock_path = cfg.state_dir / ANALYTICS_LOCK
     try:
         with file_lock(lock_path, timeout_seconds=5.0):
-            wb = load_or_create_workbook(cfg.log_path)
-            _upsert_sheet(
+            # Analytics live in their own write-only workbook so the input log is never reloaded/rewritten here.
+            wb = Workbook(write_only=True)
+            _write_sheet(
                 wb,
                 DAILY_SHEET,
                 ["date", "total_hours", "top_categories", "category_breakdown_json", "narrative", "suggestions_json"],
                 daily_rows,
             )
-            _upsert_sheet(
+            _write_sheet(
                 wb,
                 WEEKLY_SHEET,
                 [
@@ -543,30 +714,30 @@ def write_analytics(cfg: Config) -> tuple[Path, datetime, List[dict]]:
                 ],
                 weekly_rows,
             )
-            _upsert_sheet(
+            _write_sheet(
                 wb,
                 MISSED_SHEET,
                 ["date", "expected", "actual", "missed", "largest_gap_hours"],
                 missed_rows,
             )
-            _upsert_sheet(
+            _write_sheet(
                 wb,
                 TASK_HISTORY_SHEET,
                 ["timestamp", "task_id", "action", "minutes", "effort", "could_be_faster", "notes"],
                 task_history_rows,
             )
-            atomic_save_workbook(wb, cfg.log_path)
+            atomic_save_workbook(wb, analytics_path)
     except (TimeoutError, PermissionError) as exc:
-        _log_warn(cfg, f"Skipped Excel analytics write: {exc}")
+        log(f"Skipped Excel analytics write: {exc}")
     except Exception as exc:
         # If the workbook is open/locked, keep the HTML report updated anyway.
-        _log_warn(cfg, f"Analytics workbook update failed: {exc}")
+        log(f"Analytics workbook update failed: {exc}")
     for msg in warnings:
-        _log_warn(cfg, msg)
+        log(msg)
     return report_path, updated_at, entries
 
 
-def _daily_task_summary(task_events: List[dict]) -> Tuple[List[List[object]], bool]:
+def _daily_task_summary(task_events: List[dict]) -> Tuple[List[Tuple[str, List[Tuple[str, int]], int]], bool]:
     by_day: Dict[str, Dict[str, int]] = defaultdict(dict)
     invalid_row_seen = False
     for ev in task_events:
@@ -589,13 +760,59 @@ def _daily_task_summary(task_events: List[dict]) -> Tuple[List[List[object]], bo
         day_map = by_day.setdefault(day, {})
         day_map[str(task_id)] = day_map.get(str(task_id), 0) + minutes
 
-    rows: List[List[object]] = []
+    rows: List[Tuple[str, List[Tuple[str, int]], int]] = []
     for day, task_map in sorted(by_day.items()):
         top = sorted(task_map.items(), key=lambda kv: kv[1], reverse=True)[:5]
-        rows.append([day, json.dumps(top), sum(task_map.values())])
+        rows.append((day, top, sum(task_map.values())))
     return rows, invalid_row_seen
 
 
+_REPORT_HEAD = """<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <title>Hourly Tracker Report</title>
+  <style>
+    body {{ font-family: Segoe UI, Arial, sans-serif; margin: 24px; color: #111; }}
+    h1, h2 {{ margin-bottom: 8px; }}
+    table {{ border-collapse: collapse; width: 100%; margin: 12px 0 24px; }}
+    th, td {{ border: 1px solid #ddd; padding: 8px; font-size: 13px; vertical-align: top; }}
+    th {{ background: #f4f6f8; text-align: left; position: sticky; top: 0; }}
+    .muted {{ color: #555; font-size: 12px; }}
+    code {{ background: #f2f2f2; padding: 2px 4px; border-radius: 4px; }}
+  </style>
+</head>
+<body>
+  <h1>Hourly Tracker Report</h1>
+  <p class="muted">Report updated at {updated_text} (local time).</p>
+  <p class="muted">
+    Source workbook: {log_path}<br/>
+    Total entries loaded: {total_entries}<br/>
+    Entries today: {today_entries}<br/>
+    {warnings}
+  </p>
+"""
+
+_REPORT_FOOT = """
+  <p class="muted">All analytics are computed locally. No network calls are required.</p>
+</body>
+</html>"""
+
+# Cell values include user-typed text (activities, notes), so escape them.
+_esc = partial(html.escape, quote=False)
+
+
+def _write_table(fh, headers: List[str], rows: List[List[object]]) -> None:
+    fh.write("<table><thead><tr>")
+    fh.write("".join(f"<th>{_esc(h)}</th>" for h in headers))
+    fh.write("</tr></thead><tbody>")
+    if not rows:
+        fh.write("<tr><td colspan='99'>No data</td></tr>")
+    for row in rows:
+        fh.write("<tr>" + "".join(f"<td>{_esc(str(c))}</td>" for c in row) + "</tr>\n")
+    fh.write("</tbody></table>")
+
+
 def write_html_report(
     report_path: Path,
     daily_rows: List[List[object]],
@@ -612,41 +829,18 @@ def write_html_report(
     report_path.parent.mkdir(parents=True, exist_ok=True)
     updated_text = updated_at.isoformat(timespec="seconds")
 
-    def _rows_to_table(headers: List[str], rows: List[List[object]]) -> str:
-        head_html = "".join(f"<th>{h}</th>" for h in headers)
-        body_parts: List[str] = []
-        for row in rows:
-            cells = "".join(f"<td>{str(c)}</td>" for c in row)
-            body_parts.append(f"<tr>{cells}</tr>")
-        body_html = "\n".join(body_parts) if body_parts else "<tr><td colspan='99'>No data</td></tr>"
-        return f"<table><thead><tr>{head_html}</tr></thead><tbody>{body_html}</tbody></table>"
-
-    daily_table = _rows_to_table(
-        ["date", "total_hours", "top_categories", "narrative", "suggestions_json"],
-        [[r[0], r[1], r[2], r[4], r[5]] for r in daily_rows[-14:]],
-    )
-    weekly_table = _rows_to_table(
-        ["week_start", "week_end", "total_hours", "top_categories", "narrative", "suggestions_json"],
-        [[r[0], r[1], r[2], r[3], r[7], r[8]] for r in weekly_rows[-8:]],
-    )
-    missed_table = _rows_to_table(
-        ["date", "expected", "actual", "missed", "largest_gap_hours"],
-        missed_rows[-30:],
-    )
-
     task_title_by_id = {str(t.get("id")): str(t.get("title") or "") for t in tasks}
+    # Format each task's "id | title" label once rather than once per history row.
+    task_label_by_id = {task_id: f"{task_id} | {title}".strip(" |") for task_id, title in task_title_by_id.items()}
     task_history_display = []
-    for row in task_history_rows[-100:]:
-        task_id = str(row[1])
-        title = task_title_by_id.get(task_id, "")
-        task_history_display.append([row[0], f"{task_id} | {title}".strip(" |"), row[2], row[3], row[4], row[5], row[6]])
-
-    task_history_table = _rows_to_table(
-        ["timestamp", "task", "action", "minutes", "effort", "could_be_faster", "notes"],
-        task_history_display,
-    )
-
-    daily_task_rows, invalid_task_history = _daily_task_summary(
+    for ts, raw_id, action, minutes, effort, could_be_faster, notes in task_history_rows[-100:]:
+        task_id = str(raw_id)
+        label = task_label_by_id.get(task_id)
+        if label is None:
+            label = task_id.strip(" |")
+        task_history_display.append([ts, label, action, minutes, effort, could_be_faster, notes])
+
+    daily_task_summary, invalid_task_history = _daily_task_summary(
         [
             {
                 "timestamp": r[0],
@@ -656,64 +850,47 @@ def write_html_report(
             for r in task_history_rows
         ]
     )
+    # Serialize once, after swapping task ids for titles.
     daily_task_rows = [
-        [
-            r[0],
-            json.dumps([(task_title_by_id.get(t[0], t[0]), t[1]) for t in json.loads(r[1])]),
-            r[2],
-        ]
-        for r in daily_task_rows
+        [day, _dumps([(task_title_by_id.get(task_id, task_id), minutes) for task_id, minutes in top]), total]
+        for day, top, total in daily_task_summary
     ]
     if invalid_task_history:
         warnings.append("Skipped invalid task rows in Task_Events (non-numeric minutes).")
-    daily_task_table = _rows_to_table(
-        ["date", "top_tasks_json", "total_minutes"],
-        daily_task_rows[-30:],
-    )
-
-    html = f"""
-<!doctype html>
-<html lang=\"en\">
-<head>
-  <meta charset=\"utf-8\" />
-  <title>Hourly Tracker Report</title>
-  <style>
-    body {{ font-family: Segoe UI, Arial, sans-serif; margin: 24px; color: #111; }}
-    h1, h2 {{ margin-bottom: 8px; }}
-    table {{ border-collapse: collapse; width: 100%; margin: 12px 0 24px; }}
-    th, td {{ border: 1px solid #ddd; padding: 8px; font-size: 13px; vertical-align: top; }}
-    th {{ background: #f4f6f8; text-align: left; position: sticky; top: 0; }}
-    .muted {{ color: #555; font-size: 12px; }}
-    code {{ background: #f2f2f2; padding: 2px 4px; border-radius: 4px; }}
-  </style>
-</head>
-<body>
-  <h1>Hourly Tracker Report</h1>
-  <p class=\"muted\">Report updated at {updated_text} (local time).</p>
-  <p class=\"muted\">
-    Source workbook: {log_path}<br/>
-    Total entries loaded: {total_entries}<br/>
-    Entries today: {today_entries}<br/>
-    {(' '.join(warnings)) if warnings else ''}
-  </p>
 
-  <h2>Daily Summaries</h2>
-  {daily_table}
-
-  <h2>Weekly Summaries</h2>
-  {weekly_table}
-
-  <h2>Missed Check-Ins</h2>
-  {missed_table}
-
-  <h2>Daily Task Summary</h2>
-  {daily_task_table}
-
-  <h2>Task History (Recent)</h2>
-  {task_history_table}
+    sections = [
+        (
+            "Daily Summaries",
+            ["date", "total_hours", "top_categories", "narrative", "suggestions_json"],
+            [[r[0], r[1], r[2], r[4], r[5]] for r in daily_rows[-14:]],
+        ),
+        (
+            "Weekly Summaries",
+            ["week_start", "week_end", "total_hours", "top_categories", "narrative", "suggestions_json"],
+            [[r[0], r[1], r[2], r[3], r[7], r[8]] for r in weekly_rows[-8:]],
+        ),
+        ("Missed Check-Ins", ["date", "expected", "actual", "missed", "largest_gap_hours"], missed_rows[-30:]),
+        ("Daily Task Summary", ["date", "top_tasks_json", "total_minutes"], daily_task_rows[-30:]),
+        (
+            "Task History (Recent)",
+            ["timestamp", "task", "action", "minutes", "effort", "could_be_faster", "notes"],
+            task_history_display,
+        ),
+    ]
 
-  <p class=\"muted\">All analytics are computed locally. No network calls are required.</p>
-</body>
-</html>
-"""
-    report_path.write_text(html.strip(), encoding="utf-8")
+    # Stream fragments straight to the file instead of assembling the whole document in memory.
+    with report_path.open("w", encoding="utf-8") as fh:
+        fh.write(
+            _REPORT_HEAD.format(
+                updated_text=updated_text,
+                log_path=_esc(log_path),
+                total_entries=total_entries,
+                today_entries=today_entries,
+                warnings=_esc(" ".join(warnings)),
+            )
+        )
+        for title, headers, rows in sections:
+            fh.write(f"\n  <h2>{title}</h2>\n  ")
+            _write_table(fh, headers, rows)
+            fh.write("\n")
+        fh.write(_REPORT_FOOT)
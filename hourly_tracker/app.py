@@ -1,21 +1,27 @@
 from __future__ import annotations
 
+import logging
 import os
+import stat
 import sys
 import threading
 import traceback
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
+from functools import lru_cache
+from operator import attrgetter
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Iterable, List, Optional
-
-from PIL import Image, ImageDraw
-from docx import Document
-import pystray
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 import json
 
+if TYPE_CHECKING:  # tray/docx dependencies are imported where they are used
+    import pystray
+    from docx.document import Document as DocxDocument
+    from PIL import Image
+
 from hourly_tracker.paths import (
+    PATH_TYPE,
     get_appdata_dir,
     get_default_expenses_path,
     get_docs_dir,
@@ -37,9 +43,25 @@ def _default_data_dir() -> Path:
     return get_docs_dir()
 
 
+# The expenses workbook location is fixed per profile; build the Path once and
+# share it (Paths are immutable).
+_DEFAULT_EXPENSES_PATH = get_default_expenses_path()
+
+
+def _default_expenses_path() -> Path:
+    return _DEFAULT_EXPENSES_PATH
+
+
+# Directories already created this process; mkdir(exist_ok=True) is still a syscall.
+_ENSURED_DIRS: set[Path] = set()
+
+
 def ensure_dir(p: Path) -> Path:
     path = Path(p)
+    if path in _ENSURED_DIRS:
+        return path
     path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(path)
     return path
 
 
@@ -67,13 +89,15 @@ class Config:
     config_path: Path | None = None
     log_lock_path: Path | None = None
     reflections_dir: Path | None = None
-    expenses_path: Path | None = field(default_factory=get_default_expenses_path)
+    expenses_path: Path | None = field(default_factory=_default_expenses_path)
     analytics_rules: AnalyticsRules = field(default_factory=AnalyticsRules)
 
     reflection_enabled: bool = True
     reflection_time_local: str = "23:30"
 
-    _PATH_FIELDS = [
+    _resolved: bool = field(default=False, init=False, repr=False, compare=False)
+
+    _PATH_FIELDS = (
         "state_dir",
         "data_dir",
         "log_path",
@@ -84,21 +108,37 @@ class Config:
         "log_lock_path",
         "reflections_dir",
         "expenses_path",
-    ]
+    )
+    _PATH_GETTERS = tuple((name, attrgetter(name)) for name in _PATH_FIELDS)
 
     def _coerce_path_fields(self) -> None:
         """Ensure all path-like attributes are Path instances."""
-        for name in self._PATH_FIELDS:
-            value = getattr(self, name, None)
-            if value is None:
+        for name, getter in self._PATH_GETTERS:
+            value = getter(self)
+            if value is None or type(value) is PATH_TYPE:
                 continue
-            if not isinstance(value, Path):
-                try:
-                    setattr(self, name, Path(value))
-                except Exception:
-                    pass
+            try:
+                self.__dict__[name] = Path(value)
+            except Exception:
+                pass
+
+    def _paths_settled(self) -> bool:
+        if not self._resolved:
+            return False
+        if self.state_dir not in _ENSURED_DIRS or self.data_dir not in _ENSURED_DIRS:
+            return False
+        for name, getter in self._PATH_GETTERS:
+            value = getter(self)
+            if value is None:
+                if name != "expenses_path":
+                    return False
+            elif type(value) is not PATH_TYPE:
+                return False
+        return True
 
     def resolve_paths(self) -> "Config":
+        if self._paths_settled():
+            return self
         self._coerce_path_fields()
 
         state_base = ensure_dir(Path(self.state_dir))
@@ -121,30 +161,62 @@ class Config:
             self.reflections_dir = data_base / "reflections"
         if self.expenses_path is not None and not isinstance(self.expenses_path, Path):
             self.expenses_path = Path(self.expenses_path)
+        self._resolved = True
         return self
 
 
+# (field name, is path field) in declaration order, minus internal bookkeeping.
+_SERIALIZE_FIELDS = tuple(
+    (f.name, f.name in Config._PATH_FIELDS) for f in fields(Config) if not f.name.startswith("_")
+)
+
+
+_FIELD_SET = frozenset(name for name, _ in _SERIALIZE_FIELDS)
+_PATH_FIELD_SET = frozenset(Config._PATH_FIELDS)
+
+
+# Parsed config.json keyed by path -> (mtime_ns, size, data), and the last text
+# seen on disk -> (mtime_ns, text), so unchanged configs are neither re-parsed
+# nor re-written.
+_CONFIG_CACHE: dict[Path, tuple[int, int, dict]] = {}
+_LAST_WRITTEN: dict[Path, tuple[int, str]] = {}
+
+
+def _read_config_json(path: Path) -> Optional[dict]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    hit = _CONFIG_CACHE.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    data = json.loads(path.read_text(encoding="utf-8"))
+    _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
 def load_config() -> Config:
     cfg = Config().resolve_paths()
-    if cfg.config_path and cfg.config_path.exists():
+    if cfg.config_path:
         try:
-            data = json.loads(cfg.config_path.read_text(encoding="utf-8"))
+            data = _read_config_json(cfg.config_path) or {}
             for key, val in data.items():
-                if hasattr(cfg, key):
-                    if key in Config._PATH_FIELDS and val is not None:
-                        try:
-                            setattr(cfg, key, Path(val))
-                        except Exception:
-                            setattr(cfg, key, val)
-                    elif key == "analytics_rules" and isinstance(val, dict):
-                        cfg.analytics_rules = AnalyticsRules(**val)
-                    else:
-                        setattr(cfg, key, val)
+                if key not in _FIELD_SET:
+                    continue
+                if key in _PATH_FIELD_SET and val is not None:
+                    try:
+                        val = Path(val)
+                    except Exception:
+                        pass
+                elif key == "analytics_rules" and isinstance(val, dict):
+                    val = AnalyticsRules(**val)
+                setattr(cfg, key, val)
+            cfg._resolved = False
             cfg.resolve_paths()
         except Exception:
             pass
     # Always enforce hardcoded expenses path per user request.
-    cfg.expenses_path = get_default_expenses_path()
+    cfg.expenses_path = _DEFAULT_EXPENSES_PATH
     return cfg
 
 
@@ -155,14 +227,37 @@ def save_config(cfg: Config) -> None:
         p = Path(p)
         cfg.config_path = p
     if p:
-        p.parent.mkdir(parents=True, exist_ok=True)
-        payload = cfg.__dict__.copy()
-        if isinstance(payload.get("analytics_rules"), AnalyticsRules):
+        ensure_dir(p.parent)
+        values = cfg.__dict__
+        payload = {
+            name: (str(value) if is_path and isinstance(value, Path) else value)
+            for name, is_path in _SERIALIZE_FIELDS
+            for value in (values[name],)
+        }
+        if isinstance(payload["analytics_rules"], AnalyticsRules):
             payload["analytics_rules"] = asdict(payload["analytics_rules"])
-        for k, v in list(payload.items()):
-            if isinstance(v, Path):
-                payload[k] = str(v)
-        p.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Kept indented: config.json is also meant to be hand-edited.
+        text = json.dumps(payload, indent=2)
+        try:
+            mtime_ns = os.stat(p).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None:
+            last = _LAST_WRITTEN.get(p)
+            if last is not None and last[0] == mtime_ns:
+                previous = last[1]
+            else:
+                previous = p.read_text(encoding="utf-8")
+            if text == previous:
+                _LAST_WRITTEN[p] = (mtime_ns, text)
+                return
+        # Write a sibling temp file and swap it in, so readers never see a
+        # truncated config and load_config needs no lock.
+        tmp = p.with_name(p.name + ".tmp")
+        with open(tmp, "wb") as fh:
+            fh.write(text.encode("utf-8"))
+        os.replace(tmp, p)
+        _LAST_WRITTEN[p] = (os.stat(p).st_mtime_ns, text)
 
 from hourly_tracker.dialogs import (
     CatchUpResult,
@@ -170,6 +265,7 @@ from hourly_tracker.dialogs import (
     PromptResult,
     TaskManagerResult,
     TkDialogRunner,
+    ReflectionInput,
     ReflectionResult,
     SpendingResult,
     catch_up_dialog,
@@ -188,12 +284,13 @@ from hourly_tracker.excel_store import (
     append_to_expenses_workbook,
     ensure_workbook,
     log_task_event,
+    log_task_events_bulk,
     upsert_daily_row,
     read_categories,
     read_tasks,
     update_task_fields,
 )
-from hourly_tracker.llm_ollama import detect_ollama, ollama_classify_category
+from hourly_tracker.llm_ollama import OLLAMA_PROBE_CACHE, detect_ollama, ollama_classify_category
 from hourly_tracker.no_network import enforce_no_network
 from hourly_tracker.notifications import Notifier
 from hourly_tracker.scheduler import Scheduler
@@ -209,9 +306,15 @@ class AppContext:
     scheduler: Scheduler
     suggester: CategorySuggester
     tray_icon: Optional[pystray.Icon] = None
+    # Last reflection document written: (path, mtime_ns after save, Document).
+    reflection_doc: Optional[tuple] = None
 
 
+@lru_cache(maxsize=1)
 def _create_icon() -> Image.Image:
+    """Draw the tray icon once; the image is constant for the process."""
+    from PIL import Image, ImageDraw
+
     size = 64
     img = Image.new("RGBA", (size, size), (255, 255, 255, 0))
     draw = ImageDraw.Draw(img)
@@ -221,14 +324,37 @@ def _create_icon() -> Image.Image:
     return img
 
 
+_EVENT_LOGGER = logging.getLogger("hourly_tracker.app")
+_EVENT_LOGGER.propagate = False
+_EVENT_LOGGER.setLevel(logging.INFO)
+_EVENT_LOG_LOCK = threading.Lock()
+_event_log_path: Optional[Path] = None
+
+
+def _event_logger(cfg: Config) -> logging.Logger:
+    """Return the app.log logger, (re)attaching its handler if state_dir changed."""
+    global _event_log_path
+    log_path = Path(cfg.state_dir) / "logs" / "app.log"
+    if log_path == _event_log_path:
+        return _EVENT_LOGGER
+    with _EVENT_LOG_LOCK:
+        if log_path != _event_log_path:
+            ensure_dir(log_path.parent)
+            # Plain FileHandler rather than RotatingFileHandler: analytics also
+            # appends to app.log, and Windows cannot rename a file held open.
+            handler = logging.FileHandler(log_path, encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", "%Y-%m-%dT%H:%M:%S"))
+            for old in list(_EVENT_LOGGER.handlers):
+                _EVENT_LOGGER.removeHandler(old)
+                old.close()
+            _EVENT_LOGGER.addHandler(handler)
+            _event_log_path = log_path
+    return _EVENT_LOGGER
+
+
 def _log_event(cfg: Config, message: str) -> None:
     try:
-        cfg.resolve_paths()
-        log_path = cfg.state_dir / "logs" / "app.log"
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().isoformat(timespec="seconds")
-        with log_path.open("a", encoding="utf-8") as fh:
-            fh.write(f"[{timestamp}] {message}\n")
+        _event_logger(cfg).info(message)
     except Exception:
         pass
 
@@ -244,13 +370,13 @@ def _notify_locked(ctx: AppContext, path: Path, exc: Exception) -> None:
 def _self_check_paths(cfg: Config) -> None:
     """Ensure key config paths are Path objects; coerce and log if not."""
     repaired: List[str] = []
-    for name in Config._PATH_FIELDS:
-        value = getattr(cfg, name, None)
-        if value is None:
+    for name, getter in Config._PATH_GETTERS:
+        value = getter(cfg)
+        if value is None or type(value) is PATH_TYPE:
             continue
         if not isinstance(value, Path):
             try:
-                setattr(cfg, name, Path(value))
+                cfg.__dict__[name] = Path(value)
                 repaired.append(name)
             except Exception:
                 _log_event(cfg, f"Could not coerce path field {name}: {value}")
@@ -259,10 +385,31 @@ def _self_check_paths(cfg: Config) -> None:
     cfg.resolve_paths()
 
 
+# Category lists keyed by workbook path -> (mtime_ns, categories); the sheet
+# rarely changes, so most prompts skip reopening the workbook.
+_CATS_CACHE: dict[Path, tuple[int, List[str]]] = {}
+
+
 def _available_categories(cfg: Config) -> List[str]:
     assert cfg.log_path is not None
-    cats = read_categories(cfg.log_path, lock_path=cfg.log_lock_path)
-    return cats or list(DEFAULT_CATEGORIES)
+    try:
+        mtime_ns = os.stat(cfg.log_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    hit = _CATS_CACHE.get(cfg.log_path)
+    if hit is not None and hit[0] == mtime_ns:
+        return hit[1]
+    cats = read_categories(cfg.log_path, lock_path=cfg.log_lock_path) or list(DEFAULT_CATEGORIES)
+    if mtime_ns is not None:
+        _CATS_CACHE[cfg.log_path] = (mtime_ns, cats)
+    return cats
+
+
+def _refresh_suggester_categories(ctx: AppContext) -> List[str]:
+    categories = _available_categories(ctx.cfg)
+    if ctx.suggester.categories is not categories:
+        ctx.suggester.categories = categories
+    return categories
 
 
 def _suggest_category(ctx: AppContext, activity: str) -> Optional[Suggestion]:
@@ -272,7 +419,7 @@ def _suggest_category(ctx: AppContext, activity: str) -> Optional[Suggestion]:
 def _build_suggester(cfg: Config, categories: Iterable[str]) -> CategorySuggester:
     assert cfg.learned_rules_path is not None
 
-    ollama_status = detect_ollama()
+    ollama_status = detect_ollama(Path(cfg.state_dir) / OLLAMA_PROBE_CACHE)
     llm_enabled = bool(cfg.llm_enabled and ollama_status.installed and cfg.llm_model in ollama_status.models)
 
     def _llm_classifier(activity: str, cats: List[str]) -> Optional[Suggestion]:
@@ -289,8 +436,7 @@ def _build_suggester(cfg: Config, categories: Iterable[str]) -> CategorySuggeste
 
 
 def _prompt_once(ctx: AppContext, prompt_type: str = "regular") -> None:
-    categories = _available_categories(ctx.cfg)
-    ctx.suggester.categories = categories
+    categories = _refresh_suggester_categories(ctx)
     open_tasks = read_tasks(ctx.cfg.log_path, status_filter="open", lock_path=ctx.cfg.log_lock_path) if ctx.cfg.log_path else []
 
     ctx.notifier.notify("Hourly Tracker", "Check-in due: what are you doing right now?")
@@ -365,42 +511,27 @@ def _persist_task_updates(ctx: AppContext, prompt_input: PromptInput) -> None:
     effort = int(prompt_input.task_effort or 3)
     could_be_faster = bool(prompt_input.task_could_be_faster)
 
-    for task_id in worked_ids:
-        try:
-            log_task_event(
-                ctx.cfg.log_path,
-                task_id=task_id,
-                action="worked",
-                minutes=minutes,
-                effort=effort,
-                could_be_faster=could_be_faster,
-                notes="",
-                lock_path=ctx.cfg.log_lock_path,
-            )
-        except WorkbookLockedError as exc:
-            _notify_locked(ctx, ctx.cfg.log_path, exc)
-            return
-
-    for task_id in completed_ids:
-        try:
-            log_task_event(
-                ctx.cfg.log_path,
-                task_id=task_id,
-                action="completed",
-                minutes=minutes,
-                effort=effort,
-                could_be_faster=could_be_faster,
-                notes="",
-                lock_path=ctx.cfg.log_lock_path,
-            )
-        except WorkbookLockedError as exc:
-            _notify_locked(ctx, ctx.cfg.log_path, exc)
-            return
+    events = [
+        {
+            "task_id": task_id,
+            "action": action,
+            "minutes": minutes,
+            "effort": effort,
+            "could_be_faster": could_be_faster,
+        }
+        for action, ids in (("worked", worked_ids), ("completed", completed_ids))
+        for task_id in ids
+    ]
+    if not events:
+        return
+    try:
+        log_task_events_bulk(ctx.cfg.log_path, events, lock_path=ctx.cfg.log_lock_path)
+    except WorkbookLockedError as exc:
+        _notify_locked(ctx, ctx.cfg.log_path, exc)
 
 
 def _catch_up(ctx: AppContext, hours_missed: int) -> None:
-    categories = _available_categories(ctx.cfg)
-    ctx.suggester.categories = categories
+    categories = _refresh_suggester_categories(ctx)
 
     ctx.notifier.notify("Hourly Tracker", f"You missed ~{hours_missed} hour(s). Let's catch up.")
 
@@ -408,14 +539,14 @@ def _catch_up(ctx: AppContext, hours_missed: int) -> None:
         return catch_up_dialog(root, hours_missed=hours_missed, categories=categories)
 
     result = ctx.dialog_runner.run(_dialog)
-    ctx.scheduler.mark_resume_handled()
-    ctx.scheduler.mark_prompted()
+    now = datetime.now()
+    ctx.scheduler.mark_resume_handled(now)
+    ctx.scheduler.mark_prompted(now)
 
     if not isinstance(result, CatchUpResult) or not result.submitted:
         ctx.scheduler.snooze(ctx.cfg.dismiss_snooze_minutes)
         return
 
-    now = datetime.now()
     hours = max(1, int(result.hours))
     interval = timedelta(minutes=ctx.cfg.interval_minutes)
 
@@ -471,10 +602,8 @@ def _log_spending(ctx: AppContext) -> None:
         return
 
     cfg = ctx.cfg
-    cfg.resolve_paths()
-    files = ensure_user_files_exist()
-    expenses_path = files["expenses"]
-    cfg.expenses_path = expenses_path
+    # upsert_daily_row resolves and (re)creates the profile workbook itself.
+    expenses_path = cfg.expenses_path or _DEFAULT_EXPENSES_PATH
     data = {
         "date": date.today(),
         "type": result.spending_input.entry_type,
@@ -504,7 +633,39 @@ def _log_spending(ctx: AppContext) -> None:
         ctx.dialog_runner.run(lambda root: error_dialog(root, "Spending log failed", "Could not append to Expenses.xlsx. Check app.log for details."))
 
 
+_BLANK_LINES = (" ",)
+
+
+def _cached_reflection_doc(ctx: AppContext, doc_path: Path) -> Optional[DocxDocument]:
+    """Reuse the in-memory document if the file is unchanged since we last saved it."""
+    cached = ctx.reflection_doc
+    if cached is None or cached[0] != doc_path:
+        return None
+    try:
+        if os.stat(doc_path).st_mtime_ns == cached[1]:
+            return cached[2]
+    except OSError:
+        pass
+    ctx.reflection_doc = None
+    return None
+
+
+def _save_docx_atomic(doc: DocxDocument, doc_path: Path) -> None:
+    tmp_path = doc_path.with_name(f"{doc_path.name}.tmp")
+    try:
+        doc.save(tmp_path)
+        os.replace(tmp_path, doc_path)
+    finally:
+        if tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
 def _save_reflection(ctx: AppContext, reflection: ReflectionInput) -> Path:
+    from docx import Document
+
     cfg = ctx.cfg
     cfg.resolve_paths()
     reflections_dir = Path(cfg.reflections_dir or (cfg.data_dir / "reflections"))
@@ -514,8 +675,17 @@ def _save_reflection(ctx: AppContext, reflection: ReflectionInput) -> Path:
     stamp = reflection.created_at.isoformat(timespec="seconds")
 
     try:
-        doc = Document(doc_path) if doc_path.exists() else Document()
-        loaded_existing = doc_path.exists()
+        doc = _cached_reflection_doc(ctx, doc_path)
+        # Drop the cache before mutating: it is only restored once the save below succeeds.
+        ctx.reflection_doc = None
+        loaded_existing = doc is not None
+        if doc is None:
+            loaded_existing = doc_path.exists()
+            doc = Document(doc_path) if loaded_existing else Document()
+        else:
+            # Parsing is skipped, but a file locked by Word must still take the fallback below.
+            with open(doc_path, "r+b"):
+                pass
     except Exception:
         # If the existing file is locked or corrupted, fall back to a timestamped filename.
         doc_path = reflections_dir / f"{reflection.date_for.isoformat()}_{reflection.created_at.strftime('%H%M%S')}.docx"
@@ -530,13 +700,17 @@ def _save_reflection(ctx: AppContext, reflection: ReflectionInput) -> Path:
         doc.add_paragraph(f"--- Added at {stamp} ---")
 
     # Preserve user-entered newlines by writing each line as its own paragraph
-    content = reflection.text or " "
-    for line in content.splitlines() or [" "]:
+    lines = reflection.text.splitlines() if reflection.text else _BLANK_LINES
+    for line in lines:
         doc.add_paragraph(line if line.strip() else " ")
     if reflection.tags:
         doc.add_paragraph(f"Tags: {reflection.tags}")
     doc.add_paragraph(f"Recorded at {stamp}")
-    doc.save(doc_path)
+    _save_docx_atomic(doc, doc_path)
+    try:
+        ctx.reflection_doc = (doc_path, os.stat(doc_path).st_mtime_ns, doc)
+    except OSError:
+        ctx.reflection_doc = None
 
     try:
         if cfg.log_path:
@@ -617,6 +791,11 @@ def _open_task_manager(ctx: AppContext) -> None:
             _notify_locked(ctx, ctx.cfg.log_path, exc)
 
 
+SHORTCUTS_SENTINEL = "shortcuts_created.flag"
+# Set once the sentinel is known to exist; the fact holds for the process lifetime.
+_SHORTCUTS_DONE = False
+
+
 def _create_windows_shortcut(shortcut_path: Path, target_path: Path) -> None:
     try:
         import pythoncom  # type: ignore
@@ -627,12 +806,16 @@ def _create_windows_shortcut(shortcut_path: Path, target_path: Path) -> None:
     pythoncom.CoInitialize()
     try:
         shell = Dispatch("WScript.Shell")
+        target_str = str(target_path)
+        try:
+            is_dir = stat.S_ISDIR(os.stat(target_str).st_mode)
+        except OSError:
+            is_dir = False
         shortcut = shell.CreateShortcut(str(shortcut_path))
-        shortcut.TargetPath = str(target_path)
-        working_dir = target_path if target_path.is_dir() else target_path.parent
-        shortcut.WorkingDirectory = str(working_dir)
+        shortcut.TargetPath = target_str
+        shortcut.WorkingDirectory = target_str if is_dir else str(target_path.parent)
         if target_path.suffix:
-            shortcut.IconLocation = str(target_path)
+            shortcut.IconLocation = target_str
         shortcut.Save()
     finally:  # pragma: no cover - platform specific
         try:
@@ -642,6 +825,7 @@ def _create_windows_shortcut(shortcut_path: Path, target_path: Path) -> None:
 
 
 def _create_shortcuts(ctx: AppContext, notify: bool = True, show_errors: bool = True) -> None:
+    global _SHORTCUTS_DONE
     desktop = Path(os.environ.get("USERPROFILE") or Path.home()) / "Desktop"
     desktop.mkdir(parents=True, exist_ok=True)
     shortcuts = [
@@ -654,7 +838,7 @@ def _create_shortcuts(ctx: AppContext, notify: bool = True, show_errors: bool =
             continue
         shortcut_path = desktop / f"{name}.lnk"
         try:
-            _create_windows_shortcut(shortcut_path, Path(target))
+            _create_windows_shortcut(shortcut_path, target if isinstance(target, Path) else Path(target))
             created_any = True
         except Exception:
             _log_event(ctx.cfg, f"shortcut creation failed for {target}\n{traceback.format_exc()}")
@@ -663,7 +847,8 @@ def _create_shortcuts(ctx: AppContext, notify: bool = True, show_errors: bool =
                     lambda root: error_dialog(root, "Shortcut error", f"Could not create shortcut for {target}. See app.log.")
                 )
     if created_any:
-        sentinel = ctx.cfg.state_dir / "shortcuts_created.flag"
+        _SHORTCUTS_DONE = True
+        sentinel = ctx.cfg.state_dir / SHORTCUTS_SENTINEL
         try:
             sentinel.write_text(datetime.now().isoformat(timespec="seconds"), encoding="utf-8")
         except Exception:
@@ -673,8 +858,12 @@ def _create_shortcuts(ctx: AppContext, notify: bool = True, show_errors: bool =
 
 
 def _ensure_shortcuts_once(ctx: AppContext) -> None:
-    sentinel = ctx.cfg.state_dir / "shortcuts_created.flag"
+    global _SHORTCUTS_DONE
+    if _SHORTCUTS_DONE:
+        return
+    sentinel = ctx.cfg.state_dir / SHORTCUTS_SENTINEL
     if sentinel.exists():
+        _SHORTCUTS_DONE = True
         return
     _create_shortcuts(ctx, notify=False, show_errors=False)
 
@@ -725,35 +914,52 @@ def _build_context() -> AppContext:
     scheduler.on_catch_up = lambda hours: _catch_up(ctx, hours)
     scheduler.on_reflection = lambda day: _handle_reflection(ctx, day)
 
-    threading.Thread(target=_ensure_shortcuts_once, args=(ctx,), daemon=True).start()
+    if not _SHORTCUTS_DONE:
+        threading.Thread(target=_ensure_shortcuts_once, args=(ctx,), daemon=True).start()
     return ctx
 
 
+def _build_tray_menu(ctx: AppContext) -> "pystray.Menu":
+    """Build the tray menu once with two-argument actions.
+
+    pystray passes (icon, item) to every action and wraps callables that take
+    fewer arguments, so matching its signature avoids an extra call layer.
+    Bound methods are looked up here rather than on every click.
+    """
+    import pystray
+
+    snooze = ctx.scheduler.snooze
+    pause = ctx.scheduler.pause
+    cfg = ctx.cfg
+    item = pystray.MenuItem
+    return pystray.Menu(
+        item("Log now", lambda _icon, _item: _prompt_once(ctx, prompt_type="manual")),
+        # snooze()/pause() fall back to the current cfg minutes.
+        item("Snooze 10m", lambda _icon, _item: snooze()),
+        item("Pause 1h", lambda _icon, _item: pause()),
+        item("Open log", lambda _icon, _item: _open_log(cfg)),
+        item("Daily reflection", lambda _icon, _item: _handle_reflection(ctx, date.today())),
+        item("Log today's spending", lambda _icon, _item: _log_spending(ctx)),
+        item("Tasks...", lambda _icon, _item: _open_task_manager(ctx)),
+        item("Create shortcuts", lambda _icon, _item: _create_shortcuts(ctx)),
+        item("Quit", lambda icon, _item: _quit(icon, ctx)),
+    )
+
+
 def run_tray_app() -> None:
+    import pystray
+
     ctx = _build_context()
 
     tray_title = "Hourly Tracker (TEST)" if is_test_profile() else "Hourly Tracker"
 
-    icon = pystray.Icon(
-        "hourly-tracker",
-        _create_icon(),
-        tray_title,
-        menu=pystray.Menu(
-            pystray.MenuItem("Log now", lambda: _prompt_once(ctx, prompt_type="manual")),
-            pystray.MenuItem("Snooze 10m", lambda: ctx.scheduler.snooze(ctx.cfg.snooze_minutes)),
-            pystray.MenuItem("Pause 1h", lambda: ctx.scheduler.pause(ctx.cfg.pause_minutes)),
-            pystray.MenuItem("Open log", lambda: _open_log(ctx.cfg)),
-            pystray.MenuItem("Daily reflection", lambda: _handle_reflection(ctx, date.today())),
-            pystray.MenuItem("Log today's spending", lambda: _log_spending(ctx)),
-            pystray.MenuItem("Tasks...", lambda: _open_task_manager(ctx)),
-            pystray.MenuItem("Create shortcuts", lambda: _create_shortcuts(ctx)),
-            pystray.MenuItem("Quit", lambda: _quit(icon, ctx)),
-        ),
-    )
+    icon = pystray.Icon("hourly-tracker", _create_icon(), tray_title, menu=_build_tray_menu(ctx))
 
     ctx.tray_icon = icon
     ctx.scheduler.start()
-    icon.run()
+    # Tk owns the main thread; the tray runs its own loop alongside it.
+    icon.run_detached()
+    ctx.dialog_runner.mainloop()
 
 
 def _quit(icon: pystray.Icon, ctx: AppContext) -> None:
@@ -761,6 +967,7 @@ def _quit(icon: pystray.Icon, ctx: AppContext) -> None:
         ctx.scheduler.stop()
     finally:
         icon.stop()
+        ctx.dialog_runner.stop()
 
 
 def main() -> None:
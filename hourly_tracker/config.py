@@ -1,34 +1,83 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass, field
-from pathlib import Path
-from typing import Any, Dict
+import copy
+import os
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, Tuple
 
-from hourly_tracker.paths import get_appdata_dir, get_default_expenses_path, get_docs_dir
+from hourly_tracker.paths import PATH_TYPE, get_appdata_dir, get_default_expenses_path, get_docs_dir
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON values a Config holds: Paths and nested dataclasses."""
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=1)
+def _json_codec() -> Tuple[Callable[[bytes], Any], Callable[[Dict[str, Any]], bytes]]:
+    """Import the JSON backend on first use; a fresh install with no config.json
+    loads defaults without ever needing it. orjson is used when available."""
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - depends on environment
+        import json
+
+        return json.loads, lambda data: json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+    return orjson.loads, lambda data: orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+
+
+def _json_loads(raw: bytes) -> Any:
+    return _json_codec()[0](raw)
+
+
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    return _json_codec()[1](data)
+
+
+# The profile and base folders come from the environment, which does not change
+# while the app runs, so the defaults are resolved once at import. Paths are
+# immutable, so every Config can share them.
+_STATE_DIR_DEFAULT = get_appdata_dir()
+_DATA_DIR_DEFAULT = get_docs_dir()
+_EXPENSES_PATH_DEFAULT = get_default_expenses_path()
 
 
 def _default_state_dir() -> Path:
     """Internal state lives under %APPDATA% by default (profile-aware)."""
-    return get_appdata_dir()
+    return _STATE_DIR_DEFAULT
 
 
 def _default_data_dir() -> Path:
     """User-facing files default to Documents\\HourlyTracker (profile-aware)."""
-    return get_docs_dir()
+    return _DATA_DIR_DEFAULT
 
 
 def _default_expenses_path() -> Path:
     """Explicit default for spending log workbook."""
-    return get_default_expenses_path()
+    return _EXPENSES_PATH_DEFAULT
+
+
+# Directories already created by this process (as strings); mkdir(exist_ok=True)
+# still costs a syscall when the directory exists.
+_ENSURED: set[str] = set()
 
 
 def ensure_app_dirs(base_dir: Path) -> Path:
+    key = os.fspath(base_dir)
+    if key in _ENSURED:
+        return base_dir
     base_dir.mkdir(parents=True, exist_ok=True)
+    _ENSURED.add(key)
     return base_dir
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsRules:
     # Each check-in represents this many hours unless a gap rule changes it.
     entry_hours: float = 1.0
@@ -36,7 +85,8 @@ class AnalyticsRules:
     gap_break_hours: float = 2.0
 
 
-@dataclass
+# Slotted: no per-instance __dict__, and field access is a slot offset load.
+@dataclass(slots=True)
 class Config:
     interval_minutes: int = 60
     snooze_minutes: int = 10
@@ -77,7 +127,10 @@ class Config:
 
     analytics_rules: AnalyticsRules = field(default_factory=AnalyticsRules)
 
-    _PATH_FIELDS = [
+    # (state_dir, data_dir) as of the last resolve_paths; internal, never persisted.
+    _resolved_bases: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
+    _PATH_FIELDS = (
         "appdata_dir",
         "state_dir",
         "data_dir",
@@ -89,22 +142,33 @@ class Config:
         "log_lock_path",
         "reflections_dir",
         "expenses_path",
-    ]
+    )
 
     def _coerce_path_fields(self) -> None:
         """Ensure every path-like field is a pathlib.Path instance."""
         for name in self._PATH_FIELDS:
-            value = getattr(self, name, None)
-            if value is None:
+            value = getattr(self, name)
+            if value is None or value.__class__ is PATH_TYPE:
                 continue
-            if not isinstance(value, Path):
-                try:
-                    setattr(self, name, Path(value))
-                except Exception:
-                    # Leave as-is if coercion fails; resolve_paths will set defaults.
-                    pass
+            try:
+                setattr(self, name, Path(value))
+            except Exception:
+                # Leave as-is if coercion fails; resolve_paths will set defaults.
+                pass
+
+    def _paths_settled(self) -> bool:
+        """True if nothing resolve_paths would change has changed since it last ran."""
+        bases = self._resolved_bases
+        if bases is None or bases[0] is not self.state_dir or bases[1] is not self.data_dir:
+            return False
+        for name in self._PATH_FIELDS:
+            if not isinstance(getattr(self, name), Path):
+                return False
+        return True
 
     def resolve_paths(self) -> "Config":
+        if self._paths_settled():
+            return self
         self._coerce_path_fields()
         # Prefer explicit state/data dirs; fall back to legacy appdata_dir.
         state_base = ensure_app_dirs(Path(self.state_dir or self.appdata_dir))
@@ -133,35 +197,66 @@ class Config:
             self.expenses_path = _default_expenses_path()
         else:
             self.expenses_path = Path(self.expenses_path)
+        self._resolved_bases = (self.state_dir, self.data_dir)
         return self
 
     def to_json_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        # Convert Paths to strings for JSON serialization.
-        for key in self._PATH_FIELDS:
-            value = data.get(key)
-            if value is not None:
-                data[key] = str(value)
+        # Shallow build: the only nested value is AnalyticsRules, whose fields
+        # are plain floats, so asdict's recursive deepcopy buys nothing.
+        # Paths become strings in the same pass, so there is no second loop.
+        data = {
+            name: (str(value) if is_path and value is not None else value)
+            for name, is_path in self._FIELD_NAMES
+            for value in (getattr(self, name),)
+        }
+        rules = self.analytics_rules
+        data["analytics_rules"] = {name: getattr(rules, name) for name in _RULES_FIELD_NAMES}
         return data
 
     @staticmethod
     def _coerce_paths(data: Dict[str, Any]) -> Dict[str, Any]:
         for key in Config._PATH_FIELDS:
             value = data.get(key)
-            if value:
+            if value and not isinstance(value, PurePath):
                 data[key] = Path(value)
         return data
 
 
+# Keys Config(**data) accepts; anything else in config.json (older/newer schema,
+# runtime-only fields) is dropped instead of failing the whole load.
+_CFG_FIELD_NAMES = tuple(f.name for f in fields(Config) if f.init)
+_CFG_FIELDS = frozenset(_CFG_FIELD_NAMES)
+# (name, is path field) per persisted field, computed once instead of per call.
+Config._FIELD_NAMES = tuple((name, name in Config._PATH_FIELDS) for name in _CFG_FIELD_NAMES)
+_RULES_FIELD_NAMES = tuple(f.name for f in fields(AnalyticsRules))
+
+# Loaded configs keyed by config.json path -> (mtime_ns or None if missing, Config).
+_LOADED: Dict[str, tuple[int | None, Config]] = {}
+
+
+def _copy_config(cfg: Config) -> Config:
+    """Independent copy so callers can mutate what load_config returns."""
+    clone = copy.copy(cfg)
+    clone.analytics_rules = copy.copy(cfg.analytics_rules)
+    return clone
+
+
 def load_config(path: Path | None = None) -> Config:
-    cfg = Config().resolve_paths()
-    cfg_path = path or cfg.config_path
-    assert cfg_path is not None
+    cfg_path = path or _default_state_dir() / "config.json"
+    try:
+        mtime_ns: int | None = os.stat(cfg_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    key = os.fspath(cfg_path)
+    hit = _LOADED.get(key)
+    if hit is not None and hit[0] == mtime_ns:
+        return _copy_config(hit[1])
 
-    if cfg_path.exists():
+    cfg = Config().resolve_paths()
+    if mtime_ns is not None:
         try:
-            data = json.loads(cfg_path.read_text(encoding="utf-8"))
-            data = Config._coerce_paths(data)
+            data = _json_loads(cfg_path.read_bytes())
+            data = Config._coerce_paths({k: v for k, v in data.items() if k in _CFG_FIELDS})
             # Handle nested analytics rules if present.
             analytics_data = data.pop("analytics_rules", None)
             cfg = Config(**data)
@@ -172,11 +267,27 @@ def load_config(path: Path | None = None) -> Config:
             # If config is corrupt, fall back to defaults but do not overwrite yet.
             cfg = Config().resolve_paths()
 
-    return cfg
+    _LOADED[key] = (mtime_ns, cfg)
+    return _copy_config(cfg)
 
 
 def save_config(cfg: Config) -> Path:
     cfg.resolve_paths()
     assert cfg.config_path is not None
-    cfg.config_path.write_text(json.dumps(cfg.to_json_dict(), indent=2), encoding="utf-8")
+    # Paths and AnalyticsRules are encoded by _json_default while emitting,
+    # so no stringified copy of the config is built first.
+    payload = {name: getattr(cfg, name) for name in _CFG_FIELD_NAMES}
+    new = _json_dumps(payload)
+    try:
+        old = cfg.config_path.read_bytes()
+    except FileNotFoundError:
+        old = None
+    if old == new:
+        return cfg.config_path
+    # Swap in a fully written temp file so readers never see a partial config.
+    tmp = cfg.config_path.with_name(cfg.config_path.name + ".tmp")
+    tmp.write_bytes(new)
+    os.replace(tmp, cfg.config_path)
+    # Coarse filesystem timestamps may not move within a save, so drop the entry.
+    _LOADED.pop(os.fspath(cfg.config_path), None)
     return cfg.config_path
@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import queue
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Callable, Iterable, List, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-import tkinter as tk
-from tkinter import ttk, messagebox
+if TYPE_CHECKING:  # tkinter is imported where a dialog is actually built
+    import tkinter as tk
+    from tkinter import ttk
 
+SUGGEST_DEBOUNCE_MS = 150
 
-@dataclass
+_STYLE: Optional[ttk.Style] = None
+
+
+@dataclass(slots=True)
 class PromptInput:
     timestamp: datetime
     activity: str
@@ -27,7 +33,7 @@ class PromptInput:
     task_could_be_faster: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptResult:
     submitted: bool
     dismissed: bool
@@ -35,7 +41,7 @@ class PromptResult:
     action: str = "dismiss"
 
 
-@dataclass
+@dataclass(slots=True)
 class CatchUpResult:
     submitted: bool
     dismissed: bool
@@ -48,7 +54,7 @@ class CatchUpResult:
     split_entries: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskManagerResult:
     submitted: bool
     dismissed: bool
@@ -57,7 +63,7 @@ class TaskManagerResult:
     updated: List[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpendingInput:
     amount: float
     entry_type: str
@@ -65,22 +71,22 @@ class SpendingInput:
     notes: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SpendingResult:
     submitted: bool
     dismissed: bool
     spending_input: Optional[SpendingInput] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflectionInput:
     date_for: date
     text: str
     tags: str = ""
-    created_at: datetime = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflectionResult:
     submitted: bool
     dismissed: bool
@@ -88,43 +94,98 @@ class ReflectionResult:
 
 
 class TkDialogRunner:
-    def __init__(self) -> None:
-        self._root_ready = threading.Event()
+    """Owns the Tk root on the thread that calls :meth:`mainloop` (the main thread).
+
+    Other threads hand dialogs over through :meth:`run`; a short ``after`` poll
+    on the Tk thread picks them up, so Tk is only ever touched from one thread.
+    """
+
+    def __init__(self, poll_ms: int = 50) -> None:
+        self._poll_ms = poll_ms
+        self._requests: "queue.SimpleQueue[Tuple[Callable[[tk.Tk], Any], threading.Event, List[Any]]]" = queue.SimpleQueue()
+        self._stopping = False
+        self._dialog_cache: Dict[str, Tuple[tk.Toplevel, Dict[str, Any]]] = {}
+        self._owner = threading.get_ident()
         self._root: Optional[tk.Tk] = None
-        self._thread = threading.Thread(target=self._run, name="tk-dialog-runner", daemon=True)
-        self._thread.start()
-        self._root_ready.wait(timeout=5)
-        if not self._root:
-            raise RuntimeError("Failed to initialize Tk root")
-
-    def _run(self) -> None:
-        root = tk.Tk()
-        root.withdraw()
-        self._root = root
-        self._root_ready.set()
+
+    def _ensure_root(self) -> tk.Tk:
+        # Created on first use so runs that never show a dialog skip Tk startup.
+        if self._root is None:
+            import tkinter as tk
+
+            root = tk.Tk()
+            root.withdraw()
+            root._hourly_dialogs = self._dialog_cache  # type: ignore[attr-defined]
+            self._root = root
+        return self._root
+
+    def mainloop(self) -> None:
+        root = self._ensure_root()
+        root.after(self._poll_ms, self._drain)
         root.mainloop()
 
-    def run(
+    def stop(self) -> None:
+        # Safe from any thread: the next poll quits the Tk loop.
+        self._stopping = True
+
+    def _drain(self) -> None:
+        root = self._root
+        if root is None:
+            return
+        if self._stopping:
+            self._dismiss_pending()
+            root.quit()
+            return
+        # Reschedule first so requests keep flowing while a dialog waits in a nested loop.
+        root.after(self._poll_ms, self._drain)
+        try:
+            dialog_func, done, slot = self._requests.get_nowait()
+        except queue.Empty:
+            return
+        slot.append(self._invoke(dialog_func))
+        done.set()
+
+    def _dismiss_pending(self) -> None:
+        # Answer everything still queued so no caller is left blocked in run() after shutdown.
+        while True:
+            try:
+                _, done, slot = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            slot.append(PromptResult(submitted=False, dismissed=True))
+            done.set()
+
+    def _invoke(
         self,
         dialog_func: Callable[[tk.Tk], Union[PromptResult, CatchUpResult, TaskManagerResult, SpendingResult, ReflectionResult]],
     ) -> Union[PromptResult, CatchUpResult, TaskManagerResult, SpendingResult, ReflectionResult]:
-        if not self._root:
-            raise RuntimeError("Tk root not available")
-
-        result_queue: "queue.Queue[Union[PromptResult, CatchUpResult, TaskManagerResult, SpendingResult, ReflectionResult]]" = queue.Queue(maxsize=1)
+        try:
+            return dialog_func(self._ensure_root())
+        except Exception:
+            return PromptResult(submitted=False, dismissed=True)
 
-        def _invoke() -> None:
-            try:
-                result = dialog_func(self._root)  # type: ignore[arg-type]
-            except Exception:
-                result = PromptResult(submitted=False, dismissed=True)
-            result_queue.put(result)
+    def run(
+        self,
+        dialog_func: Callable[[tk.Tk], Union[PromptResult, CatchUpResult, TaskManagerResult, SpendingResult, ReflectionResult]],
+    ) -> Union[PromptResult, CatchUpResult, TaskManagerResult, SpendingResult, ReflectionResult]:
+        if self._stopping:
+            return PromptResult(submitted=False, dismissed=True)
+        if threading.get_ident() == self._owner:
+            return self._invoke(dialog_func)
 
-        self._root.after(0, _invoke)
-        return result_queue.get()
+        done = threading.Event()
+        slot: List[Union[PromptResult, CatchUpResult, TaskManagerResult, SpendingResult, ReflectionResult]] = []
+        self._requests.put((dialog_func, done, slot))
+        if self._stopping:
+            # stop() may have landed after the check above and the Tk loop's final drain; answer it here.
+            self._dismiss_pending()
+        done.wait()
+        return slot[0]
 
 
 def _base_dialog(root: tk.Tk, title: str) -> tk.Toplevel:
+    import tkinter as tk
+
     win = tk.Toplevel(root)
     win.title(title)
     win.attributes("-topmost", True)
@@ -133,7 +194,72 @@ def _base_dialog(root: tk.Tk, title: str) -> tk.Toplevel:
     return win
 
 
+def _cached_dialog(
+    root: tk.Tk,
+    key: str,
+    title: str,
+    build: Callable[[tk.Toplevel, Dict[str, Any]], None],
+) -> Tuple[tk.Toplevel, Dict[str, Any]]:
+    # Dialogs are built once per root and then withdrawn/re-shown; building the widget tree is the slow part.
+    import tkinter as tk
+
+    cache: Optional[Dict[str, Tuple[tk.Toplevel, Dict[str, Any]]]] = getattr(root, "_hourly_dialogs", None)
+    if cache is None:
+        cache = {}
+        root._hourly_dialogs = cache  # type: ignore[attr-defined]
+    entry = cache.get(key)
+    cached = entry is not None and bool(entry[0].winfo_exists())
+    if entry is not None and cached and not entry[1]["active"]:
+        entry[0].title(title)
+        return entry
+    win = _base_dialog(root, title)
+    win.withdraw()
+    # A second dialog of the same kind opened while the cached one is showing gets a throwaway window.
+    ui: Dict[str, Any] = {"done": tk.BooleanVar(master=win, value=False), "active": False, "transient": cached}
+    build(win, ui)
+    if not cached:
+        cache[key] = (win, ui)
+    return win, ui
+
+
+def _show_dialog(root: tk.Tk, win: tk.Toplevel, ui: Dict[str, Any]) -> None:
+    import tkinter as tk
+
+    ui["active"] = True
+    ui["done"].set(False)
+    win.deiconify()
+    ui["focus"].focus_set()
+    # Nothing reads geometry here, so layout is left to Tk when the window maps.
+    try:
+        win.grab_set()
+    except tk.TclError:
+        # X11 refuses grabs on windows that are not mapped yet.
+        win.wait_visibility()
+        win.grab_set()
+    root.wait_variable(ui["done"])
+
+
+def _close_dialog(win: tk.Toplevel, ui: Dict[str, Any]) -> None:
+    ui["active"] = False
+    # A debounced suggestion still pending must not fire into the hidden (or next) prompt.
+    pending = ui.pop("suggest_after", None)
+    if pending:
+        win.after_cancel(pending)
+    win.grab_release()
+    if ui["transient"]:
+        win.destroy()
+    else:
+        win.withdraw()
+    ui["done"].set(True)
+
+
 def _apply_ui_style(root: tk.Tk) -> None:
+    global _STYLE
+    # ttk styles live on the Tk interpreter, so configuring them once per root is enough.
+    if _STYLE is not None and _STYLE.master is root:
+        return
+    from tkinter import ttk
+
     style = ttk.Style(root)
     try:
         style.theme_use("clam")
@@ -143,21 +269,23 @@ def _apply_ui_style(root: tk.Tk) -> None:
     style.configure("TButton", font=("Segoe UI", 10))
     style.configure("TEntry", font=("Segoe UI", 10))
     style.configure("TCombobox", font=("Segoe UI", 10))
+    _STYLE = style
 
 
-def prompt_dialog(
-    root: tk.Tk,
-    categories: Iterable[str],
-    timestamp: datetime,
-    suggested_category: Optional[str] = None,
-    suggestion_confidence: Optional[float] = None,
-    quick_entry: bool = False,
-    suggest_fn: Optional[Callable[[str], Optional[object]]] = None,
-    tasks: Optional[List[dict]] = None,
-) -> PromptResult:
-    _apply_ui_style(root)
-    cats = list(categories) or ["Other"]
-    win = _base_dialog(root, "Hourly Check-In")
+def _task_rows(tasks: List[dict]) -> Tuple[List[str], List[str]]:
+    """Return index-aligned task ids and listbox labels in a single pass."""
+    ids: List[str] = []
+    labels: List[str] = []
+    for task in tasks:
+        task_id = task.get("id")
+        ids.append(str(task_id or ""))
+        labels.append(f"{task_id} | {task.get('title')}")
+    return ids, labels
+
+
+def _build_prompt_dialog(win: tk.Toplevel, ui: Dict[str, Any], quick_entry: bool, with_tasks: bool) -> None:
+    import tkinter as tk
+    from tkinter import ttk
 
     win.minsize(560, 520)
     frame = ttk.Frame(win, padding=16)
@@ -168,18 +296,20 @@ def prompt_dialog(
 
     activity_var = tk.StringVar(value="")
     notes_var = tk.StringVar(value="")
-    category_var = tk.StringVar(value=suggested_category if suggested_category in cats else cats[0])
+    category_var = tk.StringVar(value="")
     energy_var = tk.IntVar(value=3)
     focus_var = tk.IntVar(value=3)
     user_overrode_category = tk.BooleanVar(value=False)
     task_minutes_var = tk.IntVar(value=0)
     task_effort_var = tk.IntVar(value=3)
     task_faster_var = tk.BooleanVar(value=False)
+    new_tasks_var = tk.StringVar(value="")
 
     row = 1
     ttk.Label(frame, text="Activity").grid(row=row, column=0, sticky="w", pady=(8, 2))
     activity_entry = ttk.Entry(frame, textvariable=activity_var, width=60)
     activity_entry.grid(row=row, column=1, columnspan=2, sticky="ew", pady=(8, 2))
+    ui["focus"] = activity_entry
 
     row += 1
     if not quick_entry:
@@ -189,7 +319,7 @@ def prompt_dialog(
 
         row += 1
         ttk.Label(frame, text="Category").grid(row=row, column=0, sticky="w", pady=2)
-        category_box = ttk.Combobox(frame, textvariable=category_var, values=cats, state="readonly", width=28)
+        category_box = ttk.Combobox(frame, textvariable=category_var, values=[], state="readonly", width=28)
         category_box.grid(row=row, column=1, sticky="w", pady=2)
 
         conf_label = ttk.Label(frame, text="")
@@ -202,119 +332,120 @@ def prompt_dialog(
 
         row += 1
         ttk.Label(frame, text="Energy").grid(row=row, column=0, sticky="w", pady=(6, 2))
-        energy_scale = ttk.Scale(frame, from_=1, to=5, orient="horizontal", command=lambda _: None)
-        energy_scale.set(energy_var.get())
+        # Scale and value label share one variable, so Tcl keeps them in sync without Python callbacks.
+        energy_scale = tk.Scale(frame, from_=1, to=5, resolution=1, orient="horizontal", showvalue=False, variable=energy_var)
         energy_scale.grid(row=row, column=1, sticky="ew", pady=2)
         energy_value = ttk.Label(frame, textvariable=energy_var, width=3)
         energy_value.grid(row=row, column=2, sticky="w")
 
-        def _on_energy(val: str) -> None:
-            energy_var.set(int(float(val)))
-
-        energy_scale.configure(command=_on_energy)
-
         row += 1
         ttk.Label(frame, text="Focus").grid(row=row, column=0, sticky="w", pady=(6, 2))
-        focus_scale = ttk.Scale(frame, from_=1, to=5, orient="horizontal", command=lambda _: None)
-        focus_scale.set(focus_var.get())
+        focus_scale = tk.Scale(frame, from_=1, to=5, resolution=1, orient="horizontal", showvalue=False, variable=focus_var)
         focus_scale.grid(row=row, column=1, sticky="ew", pady=2)
         focus_value = ttk.Label(frame, textvariable=focus_var, width=3)
         focus_value.grid(row=row, column=2, sticky="w")
 
-        def _on_focus(val: str) -> None:
-            focus_var.set(int(float(val)))
-
-        focus_scale.configure(command=_on_focus)
-
         row += 1
         ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, sticky="ew", pady=(12, 8))
 
         row += 1
-        ttk.Label(frame, text="Tasks (add / work / complete)").grid(row=row, column=0, columnspan=3, sticky="w")
+        tasks_heading = "Tasks (add / work / complete)" if with_tasks else "Tasks (add)"
+        ttk.Label(frame, text=tasks_heading).grid(row=row, column=0, columnspan=3, sticky="w")
 
         row += 1
         ttk.Label(frame, text="Add tasks (comma-separated)").grid(row=row, column=0, sticky="w", pady=2)
-        new_tasks_var = tk.StringVar(value="")
         new_tasks_entry = ttk.Entry(frame, textvariable=new_tasks_var, width=60)
         new_tasks_entry.grid(row=row, column=1, columnspan=2, sticky="ew", pady=2)
 
-        open_tasks = tasks or []
-        task_labels = [f"{t.get('id')} | {t.get('title')}" for t in open_tasks]
-
-        row += 1
-        ttk.Label(frame, text="Worked on (select)").grid(row=row, column=0, sticky="w", pady=2)
-        worked_list = tk.Listbox(frame, selectmode=tk.MULTIPLE, height=4, exportselection=False)
-        for label in task_labels:
-            worked_list.insert(tk.END, label)
-        worked_list.grid(row=row, column=1, columnspan=2, sticky="ew", pady=2)
-
-        row += 1
-        ttk.Label(frame, text="Completed (select)").grid(row=row, column=0, sticky="w", pady=2)
-        done_list = tk.Listbox(frame, selectmode=tk.MULTIPLE, height=4, exportselection=False)
-        for label in task_labels:
-            done_list.insert(tk.END, label)
-        done_list.grid(row=row, column=1, columnspan=2, sticky="ew", pady=2)
-
-        row += 1
-        ttk.Label(frame, text="Minutes spent").grid(row=row, column=0, sticky="w", pady=(6, 2))
-        minutes_entry = ttk.Entry(frame, textvariable=task_minutes_var, width=10)
-        minutes_entry.grid(row=row, column=1, sticky="w", pady=2)
-
-        row += 1
-        ttk.Label(frame, text="Effort (1-5)").grid(row=row, column=0, sticky="w", pady=2)
-        effort_scale = ttk.Scale(frame, from_=1, to=5, orient="horizontal", command=lambda _: None)
-        effort_scale.set(task_effort_var.get())
-        effort_scale.grid(row=row, column=1, sticky="ew", pady=2)
-        effort_value = ttk.Label(frame, textvariable=task_effort_var, width=3)
-        effort_value.grid(row=row, column=2, sticky="w")
-
-        def _on_effort(val: str) -> None:
-            task_effort_var.set(int(float(val)))
-
-        effort_scale.configure(command=_on_effort)
-
-        row += 1
-        faster_check = ttk.Checkbutton(frame, text="Could have been faster if I locked in", variable=task_faster_var)
-        faster_check.grid(row=row, column=0, columnspan=3, sticky="w", pady=(2, 4))
+        # Worked/completed tracking only applies when there are open tasks to pick from.
+        if with_tasks:
+            row += 1
+            ttk.Label(frame, text="Worked on (select)").grid(row=row, column=0, sticky="w", pady=2)
+            worked_list = tk.Listbox(frame, selectmode=tk.MULTIPLE, height=4, exportselection=False)
+            worked_list.grid(row=row, column=1, columnspan=2, sticky="ew", pady=2)
+
+            row += 1
+            ttk.Label(frame, text="Completed (select)").grid(row=row, column=0, sticky="w", pady=2)
+            done_list = tk.Listbox(frame, selectmode=tk.MULTIPLE, height=4, exportselection=False)
+            done_list.grid(row=row, column=1, columnspan=2, sticky="ew", pady=2)
+
+            row += 1
+            ttk.Label(frame, text="Minutes spent").grid(row=row, column=0, sticky="w", pady=(6, 2))
+            minutes_entry = ttk.Entry(frame, textvariable=task_minutes_var, width=10)
+            minutes_entry.grid(row=row, column=1, sticky="w", pady=2)
+
+            row += 1
+            ttk.Label(frame, text="Effort (1-5)").grid(row=row, column=0, sticky="w", pady=2)
+            effort_scale = tk.Scale(frame, from_=1, to=5, resolution=1, orient="horizontal", showvalue=False, variable=task_effort_var)
+            effort_scale.grid(row=row, column=1, sticky="ew", pady=2)
+            effort_value = ttk.Label(frame, textvariable=task_effort_var, width=3)
+            effort_value.grid(row=row, column=2, sticky="w")
+
+            row += 1
+            faster_check = ttk.Checkbutton(frame, text="Could have been faster if I locked in", variable=task_faster_var)
+            faster_check.grid(row=row, column=0, columnspan=3, sticky="w", pady=(2, 4))
 
     row += 1
     button_frame = ttk.Frame(frame)
     button_frame.grid(row=row, column=0, columnspan=3, sticky="e", pady=(10, 0))
 
-    result: PromptResult = PromptResult(submitted=False, dismissed=True)
+    def _reset(cats: List[str], suggested_category: Optional[str], open_tasks: List[dict]) -> None:
+        activity_var.set("")
+        notes_var.set("")
+        category_var.set(suggested_category if suggested_category in cats else cats[0])
+        energy_var.set(3)
+        focus_var.set(3)
+        user_overrode_category.set(False)
+        task_minutes_var.set(0)
+        task_effort_var.set(3)
+        task_faster_var.set(False)
+        new_tasks_var.set("")
+        if quick_entry:
+            return
+        if cats != ui.get("cats"):
+            category_box.configure(values=cats)
+            ui["cats"] = cats
+        conf_label.configure(text="")
+        if not with_tasks:
+            return
+        # Resolved once per show so submit maps listbox indices straight to ids.
+        ui["task_ids"], task_labels = _task_rows(open_tasks)
+        worked_list.delete(0, tk.END)
+        done_list.delete(0, tk.END)
+        worked_list.insert(tk.END, *task_labels)
+        done_list.insert(tk.END, *task_labels)
+
+    ui["reset"] = _reset
 
     def _submit(prompt_type: str = "regular") -> None:
-        nonlocal result
         activity = activity_var.get().strip()
         if not activity:
             activity_entry.focus_set()
             return
+        # Each var read is a Tcl round trip, so fields whose widgets are not shown keep their defaults.
+        notes = ""
         new_tasks_raw: List[str] = []
         worked_ids: List[str] = []
         completed_ids: List[str] = []
+        task_minutes, task_effort, task_faster = 0, 3, False
         if not quick_entry:
-            try:
-                new_tasks_raw = [t.strip() for t in new_tasks_var.get().split(",") if t.strip()]
-            except Exception:
-                new_tasks_raw = []
-            for idx in worked_list.curselection():
-                try:
-                    worked_ids.append(open_tasks[idx].get("id"))
-                except Exception:
-                    pass
-            for idx in done_list.curselection():
-                try:
-                    completed_ids.append(open_tasks[idx].get("id"))
-                except Exception:
-                    pass
-        result = PromptResult(
+            notes = notes_var.get().strip()
+            new_tasks_raw = [t.strip() for t in new_tasks_var.get().split(",") if t.strip()]
+        if with_tasks:
+            task_ids = ui["task_ids"]
+            worked_ids = [task_ids[idx] for idx in worked_list.curselection() if task_ids[idx]]
+            completed_ids = [task_ids[idx] for idx in done_list.curselection() if task_ids[idx]]
+            task_minutes = int(task_minutes_var.get() or 0)
+            task_effort = int(task_effort_var.get() or 3)
+            task_faster = bool(task_faster_var.get())
+        ui["result"] = PromptResult(
             submitted=True,
             dismissed=False,
             action=prompt_type,
             prompt_input=PromptInput(
-                timestamp=timestamp,
+                timestamp=ui["timestamp"],
                 activity=activity,
-                notes=notes_var.get().strip(),
+                notes=notes,
                 category=category_var.get().strip() or "Other",
                 energy=energy_var.get(),
                 focus=focus_var.get(),
@@ -322,15 +453,15 @@ def prompt_dialog(
                 new_tasks=new_tasks_raw,
                 worked_task_ids=worked_ids,
                 completed_task_ids=completed_ids,
-                task_minutes=int(task_minutes_var.get() or 0),
-                task_effort=int(task_effort_var.get() or 3),
-                task_could_be_faster=bool(task_faster_var.get()),
+                task_minutes=task_minutes,
+                task_effort=task_effort,
+                task_could_be_faster=task_faster,
             ),
         )
-        win.destroy()
+        _close_dialog(win, ui)
 
     def _dismiss() -> None:
-        win.destroy()
+        _close_dialog(win, ui)
 
     def _driving() -> None:
         activity_var.set("Driving / In transit")
@@ -343,67 +474,112 @@ def prompt_dialog(
     dismiss_btn = ttk.Button(button_frame, text="Dismiss", command=_dismiss)
     dismiss_btn.grid(row=0, column=2, padx=4)
 
+    win.protocol("WM_DELETE_WINDOW", _dismiss)
     win.bind("<Return>", lambda _: _submit())
     win.bind("<Escape>", lambda _: _dismiss())
 
-    activity_entry.focus_set()
+    if not quick_entry:
+        # Called per keystroke, so the label is updated through Tcl directly rather than configure().
+        tk_call = conf_label.tk.call
+        conf_w = conf_label._w
 
-    if suggest_fn and not quick_entry:
-        def _update_suggestion(_: object = None) -> None:
-            if user_overrode_category.get():
+        def _set_conf(text: str) -> None:
+            tk_call(conf_w, "configure", "-text", text)
+
+        def _run_suggestion() -> None:
+            ui["suggest_after"] = None
+            suggest_fn = ui.get("suggest_fn")
+            if not suggest_fn or user_overrode_category.get():
                 return
             activity = activity_var.get().strip()
             if not activity:
-                conf_label.configure(text="")
+                _set_conf("")
                 return
             try:
                 suggestion = suggest_fn(activity)
                 category = getattr(suggestion, "category", None) if suggestion else None
                 confidence = getattr(suggestion, "confidence", None) if suggestion else None
-                if category in cats:
+                if category in ui["cats"]:
                     category_var.set(category)
                     if confidence is not None:
-                        conf_label.configure(text=f"Suggested ({float(confidence):.0%})")
+                        _set_conf(f"Suggested ({float(confidence):.0%})")
                     else:
-                        conf_label.configure(text="Suggested")
+                        _set_conf("Suggested")
                 else:
-                    conf_label.configure(text="")
+                    _set_conf("")
             except Exception:
-                conf_label.configure(text="")
+                _set_conf("")
 
-        activity_entry.bind("<KeyRelease>", _update_suggestion)
+        def _update_suggestion(_: object = None) -> None:
+            if not ui.get("suggest_fn") or user_overrode_category.get():
+                return
+            pending = ui.get("suggest_after")
+            if pending:
+                activity_entry.after_cancel(pending)
+            ui["suggest_after"] = activity_entry.after(SUGGEST_DEBOUNCE_MS, _run_suggestion)
 
-    win.update_idletasks()
-    win.grab_set()
-    root.wait_window(win)
-    return result
+        activity_entry.bind("<KeyRelease>", _update_suggestion)
 
 
-def catch_up_dialog(root: tk.Tk, hours_missed: int, categories: Iterable[str]) -> CatchUpResult:
+def prompt_dialog(
+    root: tk.Tk,
+    categories: Iterable[str],
+    timestamp: datetime,
+    suggested_category: Optional[str] = None,
+    suggestion_confidence: Optional[float] = None,
+    quick_entry: bool = False,
+    suggest_fn: Optional[Callable[[str], Optional[object]]] = None,
+    tasks: Optional[List[dict]] = None,
+) -> PromptResult:
     _apply_ui_style(root)
     cats = list(categories) or ["Other"]
-    win = _base_dialog(root, "Catch-Up Check-In")
+    open_tasks = tasks or []
+    # Layout differs by mode, so each variant is cached separately.
+    with_tasks = bool(open_tasks) and not quick_entry
+    if quick_entry:
+        key = "prompt-quick"
+    else:
+        key = "prompt" if with_tasks else "prompt-no-tasks"
+    win, ui = _cached_dialog(
+        root,
+        key,
+        "Hourly Check-In",
+        lambda w, u: _build_prompt_dialog(w, u, quick_entry, with_tasks),
+    )
+    ui["reset"](cats, suggested_category, open_tasks)
+    ui["timestamp"] = timestamp
+    # Memoized per prompt: backspacing and retyping asks for the same text again, and suggest_fn may
+    # consult a local LLM. Assumes suggest_fn is pure for the lifetime of one dialog.
+    ui["suggest_fn"] = lru_cache(maxsize=128)(suggest_fn) if suggest_fn else None
+    ui["result"] = PromptResult(submitted=False, dismissed=True)
+    _show_dialog(root, win, ui)
+    return ui["result"]
+
+
+def _build_catch_up_dialog(win: tk.Toplevel, ui: Dict[str, Any]) -> None:
+    import tkinter as tk
+    from tkinter import ttk
 
     win.minsize(520, 380)
     frame = ttk.Frame(win, padding=16)
     frame.grid(row=0, column=0, sticky="nsew")
     frame.columnconfigure(1, weight=1)
 
-    ttk.Label(frame, text=f"You missed about {hours_missed} hour(s). What were you doing?").grid(
-        row=0, column=0, columnspan=3, sticky="w"
-    )
+    heading = ttk.Label(frame, text="")
+    heading.grid(row=0, column=0, columnspan=3, sticky="w")
 
     activity_var = tk.StringVar(value="")
     notes_var = tk.StringVar(value="")
-    category_var = tk.StringVar(value=cats[0])
+    category_var = tk.StringVar(value="")
     energy_var = tk.IntVar(value=3)
     focus_var = tk.IntVar(value=3)
-    split_var = tk.BooleanVar(value=hours_missed > 1)
+    split_var = tk.BooleanVar(value=False)
 
     row = 1
     ttk.Label(frame, text="Activity").grid(row=row, column=0, sticky="w", pady=(8, 2))
     activity_entry = ttk.Entry(frame, textvariable=activity_var, width=60)
     activity_entry.grid(row=row, column=1, columnspan=2, sticky="ew", pady=(8, 2))
+    ui["focus"] = activity_entry
 
     row += 1
     ttk.Label(frame, text="Notes").grid(row=row, column=0, sticky="w", pady=2)
@@ -412,7 +588,7 @@ def catch_up_dialog(root: tk.Tk, hours_missed: int, categories: Iterable[str]) -
 
     row += 1
     ttk.Label(frame, text="Category").grid(row=row, column=0, sticky="w", pady=2)
-    category_box = ttk.Combobox(frame, textvariable=category_var, values=cats, state="readonly", width=28)
+    category_box = ttk.Combobox(frame, textvariable=category_var, values=[], state="readonly", width=28)
     category_box.grid(row=row, column=1, sticky="w", pady=2)
 
     row += 1
@@ -421,46 +597,46 @@ def catch_up_dialog(root: tk.Tk, hours_missed: int, categories: Iterable[str]) -
 
     row += 1
     ttk.Label(frame, text="Energy").grid(row=row, column=0, sticky="w", pady=2)
-    energy_scale = ttk.Scale(frame, from_=1, to=5, orient="horizontal", command=lambda _: None)
-    energy_scale.set(energy_var.get())
+    energy_scale = tk.Scale(frame, from_=1, to=5, resolution=1, orient="horizontal", showvalue=False, variable=energy_var)
     energy_scale.grid(row=row, column=1, sticky="ew", pady=2)
     energy_value = ttk.Label(frame, textvariable=energy_var, width=3)
     energy_value.grid(row=row, column=2, sticky="w")
 
-    def _on_energy(val: str) -> None:
-        energy_var.set(int(float(val)))
-
-    energy_scale.configure(command=_on_energy)
-
     row += 1
     ttk.Label(frame, text="Focus").grid(row=row, column=0, sticky="w", pady=2)
-    focus_scale = ttk.Scale(frame, from_=1, to=5, orient="horizontal", command=lambda _: None)
-    focus_scale.set(focus_var.get())
+    focus_scale = tk.Scale(frame, from_=1, to=5, resolution=1, orient="horizontal", showvalue=False, variable=focus_var)
     focus_scale.grid(row=row, column=1, sticky="ew", pady=2)
     focus_value = ttk.Label(frame, textvariable=focus_var, width=3)
     focus_value.grid(row=row, column=2, sticky="w")
 
-    def _on_focus(val: str) -> None:
-        focus_var.set(int(float(val)))
-
-    focus_scale.configure(command=_on_focus)
-
     row += 1
     button_frame = ttk.Frame(frame)
     button_frame.grid(row=row, column=0, columnspan=3, sticky="e", pady=(10, 0))
 
-    result: CatchUpResult = CatchUpResult(submitted=False, dismissed=True, hours=hours_missed)
+    def _reset(hours_missed: int, cats: List[str]) -> None:
+        heading.configure(text=f"You missed about {hours_missed} hour(s). What were you doing?")
+        activity_var.set("")
+        notes_var.set("")
+        if cats != ui.get("cats"):
+            category_box.configure(values=cats)
+            ui["cats"] = cats
+        category_var.set(cats[0])
+        energy_var.set(3)
+        focus_var.set(3)
+        split_var.set(hours_missed > 1)
+        ui["hours"] = hours_missed
+
+    ui["reset"] = _reset
 
     def _submit() -> None:
-        nonlocal result
         activity = activity_var.get().strip()
         if not activity:
             activity_entry.focus_set()
             return
-        result = CatchUpResult(
+        ui["result"] = CatchUpResult(
             submitted=True,
             dismissed=False,
-            hours=hours_missed,
+            hours=ui["hours"],
             activity=activity,
             notes=notes_var.get().strip(),
             category=category_var.get().strip() or "Other",
@@ -468,29 +644,34 @@ def catch_up_dialog(root: tk.Tk, hours_missed: int, categories: Iterable[str]) -
             focus=focus_var.get(),
             split_entries=split_var.get(),
         )
-        win.destroy()
+        _close_dialog(win, ui)
 
     def _dismiss() -> None:
-        win.destroy()
+        _close_dialog(win, ui)
 
     log_btn = ttk.Button(button_frame, text="Log", command=_submit)
     log_btn.grid(row=0, column=0, padx=4)
     dismiss_btn = ttk.Button(button_frame, text="Dismiss", command=_dismiss)
     dismiss_btn.grid(row=0, column=1, padx=4)
 
+    win.protocol("WM_DELETE_WINDOW", _dismiss)
     win.bind("<Return>", lambda _: _submit())
     win.bind("<Escape>", lambda _: _dismiss())
 
-    activity_entry.focus_set()
-    win.update_idletasks()
-    win.grab_set()
-    root.wait_window(win)
-    return result
-
 
-def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
+def catch_up_dialog(root: tk.Tk, hours_missed: int, categories: Iterable[str]) -> CatchUpResult:
     _apply_ui_style(root)
-    win = _base_dialog(root, "Task Manager")
+    cats = list(categories) or ["Other"]
+    win, ui = _cached_dialog(root, "catch_up", "Catch-Up Check-In", _build_catch_up_dialog)
+    ui["reset"](hours_missed, cats)
+    ui["result"] = CatchUpResult(submitted=False, dismissed=True, hours=hours_missed)
+    _show_dialog(root, win, ui)
+    return ui["result"]
+
+
+def _build_task_manager_dialog(win: tk.Toplevel, ui: Dict[str, Any]) -> None:
+    import tkinter as tk
+    from tkinter import ttk
 
     win.minsize(560, 420)
     frame = ttk.Frame(win, padding=16)
@@ -499,16 +680,14 @@ def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
 
     ttk.Label(frame, text="Open Tasks").grid(row=0, column=0, columnspan=3, sticky="w")
 
-    task_labels = [f"{t.get('id')} | {t.get('title')}" for t in tasks]
     listbox = tk.Listbox(frame, selectmode=tk.SINGLE, height=8, exportselection=False)
-    for label in task_labels:
-        listbox.insert(tk.END, label)
     listbox.grid(row=1, column=0, columnspan=3, sticky="ew", pady=(4, 8))
 
     ttk.Label(frame, text="Add tasks (comma-separated)").grid(row=2, column=0, sticky="w")
     add_var = tk.StringVar(value="")
     add_entry = ttk.Entry(frame, textvariable=add_var, width=60)
     add_entry.grid(row=2, column=1, columnspan=2, sticky="ew", pady=2)
+    ui["focus"] = add_entry
 
     ttk.Label(frame, text="Edit title").grid(row=3, column=0, sticky="w")
     title_var = tk.StringVar(value="")
@@ -520,7 +699,17 @@ def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
     notes_entry = ttk.Entry(frame, textvariable=notes_var, width=60)
     notes_entry.grid(row=4, column=1, columnspan=2, sticky="ew", pady=2)
 
-    result = TaskManagerResult(submitted=False, dismissed=True, added_tasks=[], completed_task_ids=[], updated=[])
+    def _reset(tasks: List[dict]) -> None:
+        _, task_labels = _task_rows(tasks)
+        listbox.delete(0, tk.END)
+        if task_labels:
+            listbox.insert(tk.END, *task_labels)
+        add_var.set("")
+        title_var.set("")
+        notes_var.set("")
+        ui["tasks"] = tasks
+
+    ui["reset"] = _reset
 
     def _load_selected(_: object = None) -> None:
         selection = listbox.curselection()
@@ -529,7 +718,7 @@ def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
             notes_var.set("")
             return
         idx = selection[0]
-        task = tasks[idx]
+        task = ui["tasks"][idx]
         title_var.set(str(task.get("title") or ""))
         notes_var.set(str(task.get("notes") or ""))
 
@@ -540,9 +729,10 @@ def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
         if not selection:
             return
         idx = selection[0]
+        tasks = ui["tasks"]
         task_id = tasks[idx].get("id")
         if task_id:
-            result.completed_task_ids.append(str(task_id))
+            ui["result"].completed_task_ids.append(str(task_id))
             listbox.delete(idx)
             tasks.pop(idx)
             _load_selected()
@@ -552,9 +742,9 @@ def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
         if not selection:
             return
         idx = selection[0]
-        task_id = tasks[idx].get("id")
+        task_id = ui["tasks"][idx].get("id")
         if task_id:
-            result.updated.append(
+            ui["result"].updated.append(
                 {
                     "id": str(task_id),
                     "title": title_var.get().strip(),
@@ -563,16 +753,16 @@ def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
             )
 
     def _submit() -> None:
-        nonlocal result
+        result = ui["result"]
         added = [t.strip() for t in add_var.get().split(",") if t.strip()]
         result.added_tasks.extend(added)
         _save_update()
         result.submitted = True
         result.dismissed = False
-        win.destroy()
+        _close_dialog(win, ui)
 
     def _dismiss() -> None:
-        win.destroy()
+        _close_dialog(win, ui)
 
     button_frame = ttk.Frame(frame)
     button_frame.grid(row=5, column=0, columnspan=3, sticky="e", pady=(10, 0))
@@ -582,17 +772,23 @@ def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
     ttk.Button(button_frame, text="Done", command=_submit).grid(row=0, column=2, padx=4)
     ttk.Button(button_frame, text="Cancel", command=_dismiss).grid(row=0, column=3, padx=4)
 
+    win.protocol("WM_DELETE_WINDOW", _dismiss)
     win.bind("<Escape>", lambda _: _dismiss())
-    add_entry.focus_set()
-    win.update_idletasks()
-    win.grab_set()
-    root.wait_window(win)
-    return result
 
 
-def spending_dialog(root: tk.Tk) -> SpendingResult:
+def task_manager_dialog(root: tk.Tk, tasks: List[dict]) -> TaskManagerResult:
     _apply_ui_style(root)
-    win = _base_dialog(root, "Log Today's Spending")
+    win, ui = _cached_dialog(root, "task_manager", "Task Manager", _build_task_manager_dialog)
+    ui["reset"](tasks)
+    ui["result"] = TaskManagerResult(submitted=False, dismissed=True, added_tasks=[], completed_task_ids=[], updated=[])
+    _show_dialog(root, win, ui)
+    return ui["result"]
+
+
+def _build_spending_dialog(win: tk.Toplevel, ui: Dict[str, Any]) -> None:
+    import tkinter as tk
+    from tkinter import ttk
+
     win.minsize(420, 260)
 
     frame = ttk.Frame(win, padding=16)
@@ -608,6 +804,7 @@ def spending_dialog(root: tk.Tk) -> SpendingResult:
     ttk.Label(frame, text="Amount").grid(row=0, column=0, sticky="w", pady=(4, 2))
     amount_entry = ttk.Entry(frame, textvariable=amount_var, width=20)
     amount_entry.grid(row=0, column=1, sticky="ew", pady=(4, 2))
+    ui["focus"] = amount_entry
 
     ttk.Label(frame, text="Type").grid(row=1, column=0, sticky="w", pady=2)
     type_box = ttk.Combobox(frame, textvariable=type_var, values=["Expense", "Income"], state="readonly", width=18)
@@ -630,10 +827,16 @@ def spending_dialog(root: tk.Tk) -> SpendingResult:
     error_label = ttk.Label(frame, textvariable=error_var, foreground="red")
     error_label.grid(row=3, column=0, columnspan=2, sticky="w")
 
-    result = SpendingResult(submitted=False, dismissed=True)
+    def _reset() -> None:
+        amount_var.set("")
+        type_var.set("Expense")
+        method_var.set("Card")
+        notes_var.set("")
+        error_var.set("")
+
+    ui["reset"] = _reset
 
     def _submit() -> None:
-        nonlocal result
         try:
             amount = float(amount_var.get())
             if amount <= 0:
@@ -642,7 +845,7 @@ def spending_dialog(root: tk.Tk) -> SpendingResult:
             error_var.set("Please enter a valid amount (numeric).")
             amount_entry.focus_set()
             return
-        result = SpendingResult(
+        ui["result"] = SpendingResult(
             submitted=True,
             dismissed=False,
             spending_input=SpendingInput(
@@ -652,77 +855,97 @@ def spending_dialog(root: tk.Tk) -> SpendingResult:
                 notes=notes_var.get().strip(),
             ),
         )
-        win.destroy()
+        _close_dialog(win, ui)
 
     def _dismiss() -> None:
-        win.destroy()
+        _close_dialog(win, ui)
 
     btn_frame = ttk.Frame(frame)
     btn_frame.grid(row=4, column=0, columnspan=2, sticky="e", pady=(10, 0))
     ttk.Button(btn_frame, text="Save", command=_submit).grid(row=0, column=0, padx=4)
     ttk.Button(btn_frame, text="Cancel", command=_dismiss).grid(row=0, column=1, padx=4)
 
+    win.protocol("WM_DELETE_WINDOW", _dismiss)
     win.bind("<Return>", lambda _: _submit())
     win.bind("<Escape>", lambda _: _dismiss())
-    amount_entry.focus_set()
-    win.update_idletasks()
-    win.grab_set()
-    root.wait_window(win)
-    return result
 
 
-def reflection_dialog(root: tk.Tk, date_for: date) -> ReflectionResult:
+def spending_dialog(root: tk.Tk) -> SpendingResult:
     _apply_ui_style(root)
-    title = f"Daily Reflection - {date_for.isoformat()}"
-    win = _base_dialog(root, title)
+    win, ui = _cached_dialog(root, "spending", "Log Today's Spending", _build_spending_dialog)
+    ui["reset"]()
+    ui["result"] = SpendingResult(submitted=False, dismissed=True)
+    _show_dialog(root, win, ui)
+    return ui["result"]
+
+
+def _build_reflection_dialog(win: tk.Toplevel, ui: Dict[str, Any]) -> None:
+    import tkinter as tk
+    from tkinter import ttk
+
     win.minsize(520, 420)
 
     frame = ttk.Frame(win, padding=16)
     frame.grid(row=0, column=0, sticky="nsew")
     frame.columnconfigure(1, weight=1)
 
-    ttk.Label(frame, text=title).grid(row=0, column=0, columnspan=2, sticky="w")
+    heading = ttk.Label(frame, text="")
+    heading.grid(row=0, column=0, columnspan=2, sticky="w")
     ttk.Label(frame, text="What happened today?").grid(row=1, column=0, sticky="nw", pady=(10, 4))
     text_box = tk.Text(frame, width=70, height=12, wrap="word")
     text_box.grid(row=1, column=1, sticky="nsew", pady=(10, 4))
+    ui["focus"] = text_box
 
     ttk.Label(frame, text="Tags (optional)").grid(row=2, column=0, sticky="w", pady=(6, 2))
     tags_var = tk.StringVar(value="")
     tags_entry = ttk.Entry(frame, textvariable=tags_var, width=50)
     tags_entry.grid(row=2, column=1, sticky="ew", pady=(6, 2))
 
-    result = ReflectionResult(submitted=False, dismissed=True)
+    def _reset(title: str, date_for: date) -> None:
+        heading.configure(text=title)
+        text_box.delete("1.0", "end")
+        tags_var.set("")
+        ui["date_for"] = date_for
+
+    ui["reset"] = _reset
 
     def _submit() -> None:
-        nonlocal result
         reflection = ReflectionInput(
-            date_for=date_for,
+            date_for=ui["date_for"],
             text=text_box.get("1.0", "end").strip(),
             tags=tags_var.get().strip(),
             created_at=datetime.now(),
         )
-        result = ReflectionResult(submitted=True, dismissed=False, reflection_input=reflection)
-        win.destroy()
+        ui["result"] = ReflectionResult(submitted=True, dismissed=False, reflection_input=reflection)
+        _close_dialog(win, ui)
 
     def _dismiss() -> None:
-        win.destroy()
+        _close_dialog(win, ui)
 
     btn_frame = ttk.Frame(frame)
     btn_frame.grid(row=5, column=0, columnspan=2, sticky="e", pady=(12, 0))
     ttk.Button(btn_frame, text="Save", command=_submit).grid(row=0, column=0, padx=4)
     ttk.Button(btn_frame, text="Cancel", command=_dismiss).grid(row=0, column=1, padx=4)
 
+    win.protocol("WM_DELETE_WINDOW", _dismiss)
     win.bind("<Return>", lambda _: _submit())
     win.bind("<Control-Return>", lambda _: _submit())
     win.bind("<Escape>", lambda _: _dismiss())
-    text_box.focus_set()
-    win.update_idletasks()
-    win.grab_set()
-    root.wait_window(win)
-    return result
+
+
+def reflection_dialog(root: tk.Tk, date_for: date) -> ReflectionResult:
+    _apply_ui_style(root)
+    title = f"Daily Reflection - {date_for.isoformat()}"
+    win, ui = _cached_dialog(root, "reflection", title, _build_reflection_dialog)
+    ui["reset"](title, date_for)
+    ui["result"] = ReflectionResult(submitted=False, dismissed=True)
+    _show_dialog(root, win, ui)
+    return ui["result"]
 
 
 
 def error_dialog(root: tk.Tk, title: str, message: str) -> None:
+    from tkinter import messagebox
+
     _apply_ui_style(root)
     messagebox.showerror(title, message, parent=root)
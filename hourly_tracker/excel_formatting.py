@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import traceback
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple, Optional
+from typing import Dict, Iterable, List, Set, Tuple, Optional
 
 from openpyxl import Workbook
-from openpyxl.chart import LineChart, Reference
+from openpyxl.chart import LineChart, Reference, Series
 from openpyxl.chart.bar_chart import BarChart
 from openpyxl.formatting.rule import CellIsRule
 from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.table import Table, TableStyleInfo
 
@@ -27,31 +28,39 @@ from .excel_store import (
     atomic_save_workbook,
     file_lock,
     load_or_create_workbook,
-    read_categories,
+    lookup_categories,
     read_entries,
 )
 
 WEEKLY_CHART_SHEET = "Charts_Weekly"
 DAILY_CHART_SHEET = "Charts_Daily"
 
+# Shared style objects: openpyxl copies them into its style table on assignment, so one instance serves every sheet.
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color="F4F6F8", end_color="F4F6F8", fill_type="solid")
+_HEADER_ALIGN = Alignment(vertical="center")
+_LOW_FILL = PatternFill(start_color="FDECEC", end_color="FDECEC", fill_type="solid")
+_TABLE_STYLE = TableStyleInfo(name="TableStyleMedium2", showFirstColumn=False, showLastColumn=False, showRowStripes=True, showColumnStripes=False)
+
 
 def _style_headers(ws) -> None:
-    header_fill = PatternFill(start_color="F4F6F8", end_color="F4F6F8", fill_type="solid")
     for cell in ws[1]:
-        cell.font = Font(bold=True)
-        cell.fill = header_fill
-        cell.alignment = Alignment(vertical="center")
+        cell.font = _HEADER_FONT
+        cell.fill = _HEADER_FILL
+        cell.alignment = _HEADER_ALIGN
 
 
-def _apply_table(ws, name: str) -> None:
-    if ws.max_row < 1 or ws.max_column < 1:
+def _apply_table(ws, name: str, max_row: Optional[int] = None, max_column: Optional[int] = None) -> None:
+    # max_row/max_column scan every cell key in openpyxl; callers that already know the extent pass it in.
+    max_row = ws.max_row if max_row is None else max_row
+    max_column = ws.max_column if max_column is None else max_column
+    if max_row < 1 or max_column < 1:
         return
-    if ws.max_row < 2:
+    if max_row < 2:
         return  # need at least header + one row for a valid table ref
-    ref = f"A1:{ws.cell(row=ws.max_row, column=ws.max_column).coordinate}"
+    ref = f"A1:{get_column_letter(max_column)}{max_row}"
     table = Table(displayName=name, ref=ref)
-    style = TableStyleInfo(name="TableStyleMedium2", showFirstColumn=False, showLastColumn=False, showRowStripes=True, showColumnStripes=False)
-    table.tableStyleInfo = style
+    table.tableStyleInfo = _TABLE_STYLE
     # Replace existing table safely without clobbering TableList with a plain list.
     for existing in list(ws._tables):
         if existing.displayName == name:
@@ -66,10 +75,12 @@ def _apply_table(ws, name: str) -> None:
             raise
 
 
-def _freeze_and_filter(ws) -> None:
+def _freeze_and_filter(ws, max_row: Optional[int] = None, max_column: Optional[int] = None) -> None:
     ws.freeze_panes = "A2"
-    if ws.max_column >= 1 and ws.max_row >= 1:
-        ws.auto_filter.ref = f"A1:{ws.cell(row=ws.max_row, column=ws.max_column).coordinate}"
+    max_row = ws.max_row if max_row is None else max_row
+    max_column = ws.max_column if max_column is None else max_column
+    if max_column >= 1 and max_row >= 1:
+        ws.auto_filter.ref = f"A1:{get_column_letter(max_column)}{max_row}"
 
 
 def _category_validation(ws_entries, categories: List[str]) -> None:
@@ -84,30 +95,31 @@ def _category_validation(ws_entries, categories: List[str]) -> None:
         cat_col_idx = ENTRIES_COLUMNS.index("category") + 1
     except ValueError:
         return
-    start_cell = ws_entries.cell(row=2, column=cat_col_idx).coordinate
-    end_cell = ws_entries.cell(row=max(2, ws_entries.max_row + 200), column=cat_col_idx).coordinate
-    dv.add(f"{start_cell}:{end_cell}")
+    col = get_column_letter(cat_col_idx)
+    dv.add(f"{col}2:{col}{max(2, ws_entries.max_row + 200)}")
 
 
 def _conditional_formatting(ws_entries) -> None:
-    low_fill = PatternFill(start_color="FDECEC", end_color="FDECEC", fill_type="solid")
-
     try:
         focus_col = ENTRIES_COLUMNS.index("focus") + 1
         energy_col = ENTRIES_COLUMNS.index("energy") + 1
     except ValueError:
         return
 
-    focus_range = f"{ws_entries.cell(row=2, column=focus_col).coordinate}:{ws_entries.cell(row=max(2, ws_entries.max_row + 200), column=focus_col).coordinate}"
-    energy_range = f"{ws_entries.cell(row=2, column=energy_col).coordinate}:{ws_entries.cell(row=max(2, ws_entries.max_row + 200), column=energy_col).coordinate}"
+    # Build A1 refs directly: ws.cell() would materialise (and keep) a Cell just to read its address.
+    last_row = max(2, ws_entries.max_row + 200)
+    focus_letter = get_column_letter(focus_col)
+    energy_letter = get_column_letter(energy_col)
+    focus_range = f"{focus_letter}2:{focus_letter}{last_row}"
+    energy_range = f"{energy_letter}2:{energy_letter}{last_row}"
 
     ws_entries.conditional_formatting.add(
         focus_range,
-        CellIsRule(operator="lessThanOrEqual", formula=["2"], stopIfTrue=False, fill=low_fill),
+        CellIsRule(operator="lessThanOrEqual", formula=["2"], stopIfTrue=False, fill=_LOW_FILL),
     )
     ws_entries.conditional_formatting.add(
         energy_range,
-        CellIsRule(operator="lessThanOrEqual", formula=["2"], stopIfTrue=False, fill=low_fill),
+        CellIsRule(operator="lessThanOrEqual", formula=["2"], stopIfTrue=False, fill=_LOW_FILL),
     )
 
 
@@ -118,22 +130,27 @@ def _weekly_category_matrix(cfg: Any, entries_override: Optional[List[dict]] = N
     entries = entries_override if entries_override is not None else read_entries(cfg.log_path, lock_path=cfg.log_lock_path)
     blocks, _ = entries_to_blocks(entries, cfg)
 
-    weeks: List[str] = []
-    categories: List[str] = []
+    # Group by (day, category) first so the week arithmetic below runs per distinct day, not per block.
+    by_day: Dict[Tuple[date, str], float] = defaultdict(float)
+    for block in blocks:
+        by_day[(block.end.date(), block.category)] += block.hours
+
+    week_set: Set[str] = set()
+    category_set: Set[str] = set()
     matrix: Dict[Tuple[str, str], float] = defaultdict(float)
+    # A day shows up once per category it has hours in; resolve its week key only once.
+    week_keys: Dict[date, str] = {}
 
-    for block in blocks:
-        week_start_date = block.end.date() - timedelta(days=block.end.weekday())
-        week_key = week_start_date.isoformat()
-        if week_key not in weeks:
-            weeks.append(week_key)
-        if block.category not in categories:
-            categories.append(block.category)
-        matrix[(week_key, block.category)] += block.hours
+    for (day, category), hours in by_day.items():
+        week_key = week_keys.get(day)
+        if week_key is None:
+            week_key = (day - timedelta(days=day.weekday())).isoformat()
+            week_keys[day] = week_key
+        week_set.add(week_key)
+        category_set.add(category)
+        matrix[(week_key, category)] += hours
 
-    weeks.sort()
-    categories.sort()
-    return weeks, categories, matrix
+    return sorted(week_set), sorted(category_set), matrix
 
 
 def _build_weekly_chart_sheet(wb: Workbook, cfg: Any, entries_override: Optional[List[dict]] = None) -> None:
@@ -146,18 +163,20 @@ def _build_weekly_chart_sheet(wb: Workbook, cfg: Any, entries_override: Optional
         ws.append(["No data yet"])
         return
 
-    header = ["week_start"] + categories
-    ws.append(header)
-    for week in weeks:
-        row = [week]
-        for cat in categories:
-            row.append(round(matrix.get((week, cat), 0.0), 2))
-        ws.append(row)
+    # Scatter the sparse (week, category) totals into dense rows: one hash per populated cell, not per grid cell.
+    week_idx = {week: i for i, week in enumerate(weeks)}
+    cat_idx = {cat: j for j, cat in enumerate(categories)}
+    rows = [[0.0] * len(categories) for _ in weeks]
+    for (week, cat), hours in matrix.items():
+        rows[week_idx[week]][cat_idx[cat]] = round(hours, 2)
+
+    ws.append(("week_start", *categories))
+    for week, values in zip(weeks, rows):
+        ws.append((week, *values))
 
     _style_headers(ws)
-    _freeze_and_filter(ws)
+    _freeze_and_filter(ws, max_row=len(weeks) + 1, max_column=len(categories) + 1)
 
-    data_ref = Reference(ws, min_col=2, min_row=1, max_col=len(categories) + 1, max_row=len(weeks) + 1)
     cats_ref = Reference(ws, min_col=1, min_row=2, max_row=len(weeks) + 1)
 
     chart = BarChart()
@@ -165,7 +184,9 @@ def _build_weekly_chart_sheet(wb: Workbook, cfg: Any, entries_override: Optional
     chart.title = "Weekly Time by Category"
     chart.y_axis.title = "Hours"
     chart.x_axis.title = "Week"
-    chart.add_data(data_ref, titles_from_data=True)
+    # Titles are already in hand, so build each series directly instead of having add_data() read them from row 1.
+    for col, category in enumerate(categories, start=2):
+        chart.series.append(Series(Reference(ws, min_col=col, min_row=2, max_row=len(weeks) + 1), title=category))
     chart.set_categories(cats_ref)
     chart.width = 24
     chart.height = 12
@@ -176,27 +197,34 @@ def _build_weekly_chart_sheet(wb: Workbook, cfg: Any, entries_override: Optional
 
 def _daily_focus_series(cfg: Any, entries_override: Optional[List[dict]] = None) -> Tuple[List[str], List[float]]:
     entries = entries_override if entries_override is not None else read_entries(cfg.log_path, lock_path=cfg.log_lock_path)
-    series: List[Tuple[str, float]] = []
+    # Running sum/count per day in a single pass; no per-day value lists are kept.
+    totals: Dict[str, float] = defaultdict(float)
+    counts: Dict[str, int] = defaultdict(int)
     for row in entries:
         ts = row.get("timestamp")
         focus = row.get("focus")
         if not ts or focus is None:
             continue
+        # openpyxl already hands back datetimes and numbers for typed cells; only text needs parsing.
+        if isinstance(ts, datetime):
+            day = ts.date().isoformat()
+        else:
+            try:
+                day = datetime.fromisoformat(ts if isinstance(ts, str) else str(ts)).date().isoformat()
+            except ValueError:
+                continue
         try:
-            dt = datetime.fromisoformat(str(ts))
-            series.append((dt.date().isoformat(), float(focus)))
-        except Exception:
+            value = float(focus)
+        except (TypeError, ValueError):
             continue
+        totals[day] += value
+        counts[day] += 1
 
-    if not series:
+    if not totals:
         return [], []
 
-    by_day: Dict[str, List[float]] = defaultdict(list)
-    for day, focus in series:
-        by_day[day].append(focus)
-
-    days = sorted(by_day.keys())
-    avg_focus = [round(sum(vals) / max(1, len(vals)), 2) for vals in (by_day[d] for d in days)]
+    days = sorted(totals)
+    avg_focus = [round(totals[d] / counts[d], 2) for d in days]
     return days, avg_focus
 
 
@@ -210,21 +238,21 @@ def _build_daily_chart_sheet(wb: Workbook, cfg: Any, entries_override: Optional[
         ws.append(["No data yet"])
         return
 
-    ws.append(["date", "avg_focus"])
-    for day, focus in zip(days, avg_focus):
-        ws.append([day, focus])
+    ws.append(("date", "avg_focus"))
+    for row in zip(days, avg_focus):
+        ws.append(row)
 
     _style_headers(ws)
-    _freeze_and_filter(ws)
+    _freeze_and_filter(ws, max_row=len(days) + 1, max_column=2)
 
-    data_ref = Reference(ws, min_col=2, min_row=1, max_row=len(days) + 1)
+    data_ref = Reference(ws, min_col=2, min_row=2, max_row=len(days) + 1)
     cats_ref = Reference(ws, min_col=1, min_row=2, max_row=len(days) + 1)
 
     chart = LineChart()
     chart.title = "Daily Average Focus"
     chart.y_axis.title = "Focus (1-5)"
     chart.x_axis.title = "Date"
-    chart.add_data(data_ref, titles_from_data=True)
+    chart.series.append(Series(data_ref, title="avg_focus"))
     chart.set_categories(cats_ref)
     chart.width = 24
     chart.height = 12
@@ -239,14 +267,17 @@ def apply_excel_formatting(cfg: Any, entries_data: Optional[List[dict]] = None)
     if getattr(cfg, "log_lock_path", None) is not None and not isinstance(cfg.log_lock_path, Path):
         cfg.log_lock_path = Path(cfg.log_lock_path)
     assert cfg.log_path is not None
-
-    if entries_data is not None:
-        categories = sorted({str(e.get("category") or "Other") for e in entries_data})
-    else:
-        categories = read_categories(cfg.log_path, lock_path=cfg.log_lock_path)
+    if not entries_data and not cfg.log_path.exists():
+        # Nothing logged yet: don't create a workbook just to hold empty chart sheets.
+        return
 
     lock_path = cfg.log_lock_path or cfg.log_path.with_suffix(cfg.log_path.suffix + ".lock")
     try:
+        entries_override = entries_data
+        if entries_override is None:
+            # One read shared by both chart builders; read_entries takes the lock itself, so do it before locking below.
+            entries_override = read_entries(cfg.log_path, lock_path=cfg.log_lock_path)
+
         if entries_data is None:
             # Normal path with lock to avoid concurrent writes.
             with file_lock(lock_path):
@@ -256,21 +287,31 @@ def apply_excel_formatting(cfg: Any, entries_data: Optional[List[dict]] = None)
             wb = load_or_create_workbook(cfg.log_path)
 
         ws_entries = wb[ENTRIES_SHEET] if ENTRIES_SHEET in wb.sheetnames else wb.create_sheet(ENTRIES_SHEET)
+        if entries_data is not None:
+            # Most categories are already non-empty strings; only coerce the rest (blank/None still map to "Other").
+            categories = sorted({c if c and isinstance(c, str) else str(c or "Other") for c in (e.get("category") for e in entries_data)})
+        else:
+            # Reuse the workbook loaded above rather than parsing the file again via read_categories.
+            categories = lookup_categories(wb)
+
         ws_lookup = wb[LOOKUP_SHEET] if LOOKUP_SHEET in wb.sheetnames else wb.create_sheet(LOOKUP_SHEET)
 
         _style_headers(ws_entries)
         _style_headers(ws_lookup)
-        _freeze_and_filter(ws_entries)
-        _freeze_and_filter(ws_lookup)
+        # The helpers below only restyle or add ranges, so each sheet's extent is stable; measure it once.
+        entries_dims = (ws_entries.max_row, ws_entries.max_column)
+        lookup_dims = (ws_lookup.max_row, ws_lookup.max_column)
+        _freeze_and_filter(ws_entries, *entries_dims)
+        _freeze_and_filter(ws_lookup, *lookup_dims)
 
         _category_validation(ws_entries, categories)
         _conditional_formatting(ws_entries)
 
-        _apply_table(ws_entries, "EntriesTable")
-        _apply_table(ws_lookup, "LookupTable")
+        _apply_table(ws_entries, "EntriesTable", *entries_dims)
+        _apply_table(ws_lookup, "LookupTable", *lookup_dims)
 
-        _build_weekly_chart_sheet(wb, cfg, entries_override=entries_data)
-        _build_daily_chart_sheet(wb, cfg, entries_override=entries_data)
+        _build_weekly_chart_sheet(wb, cfg, entries_override=entries_override)
+        _build_daily_chart_sheet(wb, cfg, entries_override=entries_override)
 
         atomic_save_workbook(wb, cfg.log_path)
     except (TimeoutError, PermissionError):
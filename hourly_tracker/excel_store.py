@@ -5,9 +5,10 @@ import tempfile
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import chain, islice
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import msvcrt
 from openpyxl import Workbook, load_workbook
@@ -200,14 +201,15 @@ def _get_header_map(ws: Worksheet, expected_columns: List[str]) -> Dict[str, int
     return {str(ws.cell(row=1, column=i).value): i for i in range(1, ws.max_column + 1)}
 
 
-def _find_header_row(ws: Worksheet, expected_columns: List[str], max_scan: int = 5) -> Optional[int]:
-    for row in range(1, min(max_scan, ws.max_row) + 1):
-        values = [str(cell.value).strip() if cell.value is not None else "" for cell in ws[row]]
+def _find_header_row(rows: List[tuple], expected_columns: List[str]) -> Optional[int]:
+    """Return the 0-based index of the header among the leading value rows, if any."""
+    for idx, row in enumerate(rows):
+        values = [str(v).strip() if v is not None else "" for v in row]
         if not values:
             continue
         matches = sum(1 for col in expected_columns if col in values)
         if matches >= max(2, len(expected_columns) // 2):
-            return row
+            return idx
     return None
 
 
@@ -282,6 +284,11 @@ def append_entry(path: Path, entry: Entry, categories: Optional[Iterable[str]] =
         _atomic_save(wb, path)
 
 
+def _load_read_only(path: Path) -> Workbook:
+    # Read-only mode streams rows without building the cell/style model; callers must close().
+    return load_workbook(path, read_only=True, data_only=True, keep_links=False)
+
+
 def read_entries(path: Path, lock_path: Optional[Path] = None) -> List[Dict[str, object]]:
     path = _as_path(path)
     if not path.exists():
@@ -289,45 +296,38 @@ def read_entries(path: Path, lock_path: Optional[Path] = None) -> List[Dict[str,
 
     lock = _lock_path(path, lock_path)
     with file_lock(lock, timeout_seconds=5.0):
-        wb = load_workbook(path, data_only=True)
-        if ENTRIES_SHEET not in wb.sheetnames:
-            return []
-        ws = wb[ENTRIES_SHEET]
-        if ws.max_row < 1:
-            return []
-
-        def find_header_row() -> tuple[Optional[int], List[str]]:
-            # Prefer row 1; fallback scan first 20 rows for timestamp + activity.
-            candidates = [1] + list(range(1, min(20, ws.max_row) + 1))
-            seen = set()
-            for idx in candidates:
-                if idx in seen:
-                    continue
-                seen.add(idx)
-                headers = [_norm_header(c.value) for c in ws[idx]]
-                if any(headers):
-                    if "timestamp" in headers and "activity" in headers:
-                        return idx, headers
-            return None, []
-
-        header_row_idx, headers = find_header_row()
-        if not header_row_idx or not headers:
-            # Explicit log via caller; return empty to halt analytics safely.
-            return []
-
-        results: List[Dict[str, object]] = []
-        read_entries.last_headers = headers  # type: ignore[attr-defined]
-        for row in ws.iter_rows(min_row=header_row_idx + 1, values_only=True):
-            if all(v is None for v in row):
-                continue
-            row_dict: Dict[str, object] = {}
-            for h, v in zip(headers, row):
-                if not h:
+        wb = _load_read_only(path)
+        try:
+            if ENTRIES_SHEET not in wb.sheetnames:
+                return []
+            rows = wb[ENTRIES_SHEET].iter_rows(values_only=True)
+
+            # Scan the first 20 rows for timestamp + activity headers.
+            headers: List[str] = []
+            for _, row in zip(range(20), rows):
+                candidate = [_norm_header(v) for v in row]
+                if "timestamp" in candidate and "activity" in candidate:
+                    headers = candidate
+                    break
+            if not headers:
+                # Explicit log via caller; return empty to halt analytics safely.
+                return []
+
+            results: List[Dict[str, object]] = []
+            read_entries.last_headers = headers  # type: ignore[attr-defined]
+            for row in rows:
+                if all(v is None for v in row):
                     continue
-                row_dict[h] = v
-            if row_dict:
-                results.append(row_dict)
-        return results
+                row_dict: Dict[str, object] = {}
+                for h, v in zip(headers, row):
+                    if not h:
+                        continue
+                    row_dict[h] = v
+                if row_dict:
+                    results.append(row_dict)
+            return results
+        finally:
+            wb.close()
 
 
 def read_categories(path: Path, lock_path: Optional[Path] = None) -> List[str]:
@@ -351,6 +351,17 @@ def read_categories(path: Path, lock_path: Optional[Path] = None) -> List[str]:
         return cats or list(DEFAULT_CATEGORIES)
 
 
+def lookup_categories(wb: Workbook) -> List[str]:
+    """Categories from an already-loaded workbook without touching its header row (safe before a save)."""
+    if LOOKUP_SHEET not in wb.sheetnames:
+        return list(DEFAULT_CATEGORIES)
+    ws = wb[LOOKUP_SHEET]
+    header = [str(cell.value) if cell.value is not None else "" for cell in ws[1]]
+    category_col = header.index("category") + 1 if "category" in header else LOOKUP_COLUMNS.index("category") + 1
+    cats = [str(value) for (value,) in ws.iter_rows(min_row=2, min_col=category_col, max_col=category_col, values_only=True) if value]
+    return cats or list(DEFAULT_CATEGORIES)
+
+
 def read_tasks(path: Path, status_filter: Optional[str] = "open", lock_path: Optional[Path] = None) -> List[Dict[str, object]]:
     path = _as_path(path)
     if not path.exists():
@@ -358,23 +369,27 @@ def read_tasks(path: Path, status_filter: Optional[str] = "open", lock_path: Opt
 
     lock = _lock_path(path, lock_path)
     with file_lock(lock, timeout_seconds=5.0):
-        wb = load_workbook(path, data_only=True)
-        if TASKS_SHEET not in wb.sheetnames:
-            return []
-        ws = wb[TASKS_SHEET]
-        if ws.max_row < 2:
-            return []
-
-        header_row = _find_header_row(ws, TASKS_COLUMNS) or 1
-        headers = [str(cell.value).strip() if cell.value is not None else "" for cell in ws[header_row]]
-        results: List[Dict[str, object]] = []
-        for row in ws.iter_rows(min_row=header_row + 1, values_only=True):
-            row_dict = {headers[i]: row[i] for i in range(len(headers)) if headers[i]}
-            status_value = str(row_dict.get("status") or "").strip().lower()
-            if status_filter and status_value != status_filter:
-                continue
-            results.append(row_dict)
-        return results
+        wb = _load_read_only(path)
+        try:
+            if TASKS_SHEET not in wb.sheetnames:
+                return []
+            rows = wb[TASKS_SHEET].iter_rows(values_only=True)
+            leading = list(islice(rows, 5))
+            if len(leading) < 2:
+                return []
+
+            header_idx = _find_header_row(leading, TASKS_COLUMNS) or 0
+            headers = [str(v).strip() if v is not None else "" for v in leading[header_idx]]
+            results: List[Dict[str, object]] = []
+            for row in chain(leading[header_idx + 1 :], rows):
+                row_dict = {h: v for h, v in zip(headers, row) if h}
+                status_value = str(row_dict.get("status") or "").strip().lower()
+                if status_filter and status_value != status_filter:
+                    continue
+                results.append(row_dict)
+            return results
+        finally:
+            wb.close()
 
 
 def read_task_events(path: Path, lock_path: Optional[Path] = None) -> List[Dict[str, object]]:
@@ -384,32 +399,34 @@ def read_task_events(path: Path, lock_path: Optional[Path] = None) -> List[Dict[
 
     lock = _lock_path(path, lock_path)
     with file_lock(lock, timeout_seconds=5.0):
-        wb = load_workbook(path, data_only=True)
-        if TASK_EVENTS_SHEET not in wb.sheetnames:
-            return []
-        ws = wb[TASK_EVENTS_SHEET]
-        rows = ws.iter_rows(values_only=True)
+        wb = _load_read_only(path)
         try:
-            header_row = next(rows)
-        except StopIteration:
-            return []
-        headers = [_norm_header(h) for h in header_row]
-        header_set = set(headers)
-        results: List[Dict[str, object]] = []
-        for row in rows:
-            if all(v is None for v in row):
-                continue  # skip empty rows
-            # Skip if this row looks like a repeated header row (any cell matches a header name).
-            if any((_norm_header(v) in header_set) for v in row if v is not None):
-                continue
-            row_dict: Dict[str, object] = {}
-            for h, v in zip(headers, row):
-                if not h:
-                    continue  # skip blank header columns so headers never appear as data
-                row_dict[h] = v
-            if row_dict:
-                results.append(row_dict)
-        return results
+            if TASK_EVENTS_SHEET not in wb.sheetnames:
+                return []
+            rows = wb[TASK_EVENTS_SHEET].iter_rows(values_only=True)
+            try:
+                header_row = next(rows)
+            except StopIteration:
+                return []
+            headers = [_norm_header(h) for h in header_row]
+            header_set = set(headers)
+            results: List[Dict[str, object]] = []
+            for row in rows:
+                if all(v is None for v in row):
+                    continue  # skip empty rows
+                # Skip if this row looks like a repeated header row (any cell matches a header name).
+                if any((_norm_header(v) in header_set) for v in row if v is not None):
+                    continue
+                row_dict: Dict[str, object] = {}
+                for h, v in zip(headers, row):
+                    if not h:
+                        continue  # skip blank header columns so headers never appear as data
+                    row_dict[h] = v
+                if row_dict:
+                    results.append(row_dict)
+            return results
+        finally:
+            wb.close()
 
 
 def add_tasks(path: Path, titles: Iterable[str], lock_path: Optional[Path] = None) -> List[str]:
@@ -491,6 +508,29 @@ def log_task_event_with_lock(
     notes: str = "",
     lock_path: Optional[Path] = None,
 ) -> None:
+    event = {
+        "task_id": task_id,
+        "action": action,
+        "minutes": minutes,
+        "effort": effort,
+        "could_be_faster": could_be_faster,
+        "notes": notes,
+    }
+    _log_task_events(path, [event], lock_path, suffix_ids=False)
+
+
+def log_task_events_bulk(path: Path, events: Iterable[Dict[str, Any]], lock_path: Optional[Path] = None) -> None:
+    """Log several task events with a single lock/load/save of the workbook.
+
+    Each event is a dict with the ``log_task_event`` keyword arguments
+    (task_id, action, minutes, effort, could_be_faster, optional notes).
+    """
+    events = list(events)
+    if events:
+        _log_task_events(path, events, lock_path, suffix_ids=True)
+
+
+def _log_task_events(path: Path, events: List[Dict[str, Any]], lock_path: Optional[Path], suffix_ids: bool) -> None:
     path = _as_path(path)
     lock = _lock_path(path, lock_path)
     with file_lock(lock):
@@ -502,33 +542,43 @@ def log_task_event_with_lock(
         events_header = _get_header_map(events_ws, TASK_EVENTS_COLUMNS)
 
         now = datetime.now()
-        event_id = f"event_{int(now.timestamp() * 1000)}"
-
-        row_values = [""] * len(events_header)
-        row_values[events_header["id"] - 1] = event_id
-        row_values[events_header["task_id"] - 1] = task_id
-        row_values[events_header["timestamp"] - 1] = now.isoformat(timespec="seconds")
-        row_values[events_header["action"] - 1] = action
-        row_values[events_header["minutes"] - 1] = int(minutes)
-        row_values[events_header["effort"] - 1] = int(effort)
-        row_values[events_header["could_be_faster"] - 1] = bool(could_be_faster)
-        row_values[events_header["notes"] - 1] = notes
-        events_ws.append(row_values)
-
+        now_text = now.isoformat(timespec="seconds")
+        base_id = f"event_{int(now.timestamp() * 1000)}"
+        # First row wins for duplicate ids, matching _find_task_row.
         id_col = tasks_header["id"]
-        row_idx = _find_task_row(tasks_ws, task_id, id_col)
-        if row_idx:
-            if action == "worked":
-                last_worked_col = tasks_header["last_worked_at"]
-                total_minutes_col = tasks_header["total_minutes"]
-                tasks_ws.cell(row=row_idx, column=last_worked_col, value=now.isoformat(timespec="seconds"))
-                existing = tasks_ws.cell(row=row_idx, column=total_minutes_col).value or 0
-                tasks_ws.cell(row=row_idx, column=total_minutes_col, value=int(existing) + int(minutes))
-            elif action == "completed":
-                status_col = tasks_header["status"]
-                completed_col = tasks_header["completed_at"]
-                tasks_ws.cell(row=row_idx, column=status_col, value="done")
-                tasks_ws.cell(row=row_idx, column=completed_col, value=now.isoformat(timespec="seconds"))
+        task_rows: Dict[str, int] = {}
+        for row in range(tasks_ws.max_row, 1, -1):
+            task_rows[str(tasks_ws.cell(row=row, column=id_col).value)] = row
+
+        for idx, event in enumerate(events):
+            task_id = event["task_id"]
+            action = event["action"]
+            minutes = int(event["minutes"])
+
+            row_values = [""] * len(events_header)
+            row_values[events_header["id"] - 1] = f"{base_id}_{idx}" if suffix_ids else base_id
+            row_values[events_header["task_id"] - 1] = task_id
+            row_values[events_header["timestamp"] - 1] = now_text
+            row_values[events_header["action"] - 1] = action
+            row_values[events_header["minutes"] - 1] = minutes
+            row_values[events_header["effort"] - 1] = int(event["effort"])
+            row_values[events_header["could_be_faster"] - 1] = bool(event["could_be_faster"])
+            row_values[events_header["notes"] - 1] = event.get("notes", "")
+            events_ws.append(row_values)
+
+            row_idx = task_rows.get(task_id)
+            if row_idx:
+                if action == "worked":
+                    last_worked_col = tasks_header["last_worked_at"]
+                    total_minutes_col = tasks_header["total_minutes"]
+                    tasks_ws.cell(row=row_idx, column=last_worked_col, value=now_text)
+                    existing = tasks_ws.cell(row=row_idx, column=total_minutes_col).value or 0
+                    tasks_ws.cell(row=row_idx, column=total_minutes_col, value=int(existing) + minutes)
+                elif action == "completed":
+                    status_col = tasks_header["status"]
+                    completed_col = tasks_header["completed_at"]
+                    tasks_ws.cell(row=row_idx, column=status_col, value="done")
+                    tasks_ws.cell(row=row_idx, column=completed_col, value=now_text)
 
         _atomic_save(wb, path)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 from hourly_tracker.paths import (
@@ -13,30 +14,36 @@ from hourly_tracker.paths import (
 from hourly_tracker.resources_util import resource_path
 
 
+@lru_cache(maxsize=1)
+def _ensure_user_dirs() -> tuple[Path, Path, Path]:
+    """Create the profile directories once per process; their paths are fixed."""
+    dirs = (get_appdata_dir(), get_docs_dir(), get_docs_reflections_dir())
+    for p in dirs:
+        p.mkdir(parents=True, exist_ok=True)
+    return dirs
+
+
 def ensure_user_files_exist() -> dict[str, Path]:
     """
     Ensure per-user working copies exist in the profile's docs folder.
     Returns dict with keys: time_log, expenses, reflections_dir, appdata_dir, docs_dir.
     Idempotent and safe to call multiple times.
     """
-    appdata_dir = get_appdata_dir()
-    docs_dir = get_docs_dir()
-    reflections_dir = get_docs_reflections_dir()
-
-    for p in (appdata_dir, docs_dir, reflections_dir):
-        p.mkdir(parents=True, exist_ok=True)
+    appdata_dir, docs_dir, reflections_dir = _ensure_user_dirs()
 
     time_log_path = get_user_time_log_path()
     expenses_path = get_user_expenses_path()
 
-    time_log_template = resource_path("resources/time_log_template.xlsx")
-    expenses_template = resource_path("resources/Expenses.xlsx")
-
-    if time_log_template.exists() and not time_log_path.exists():
-        shutil.copy2(time_log_template, time_log_path)
+    # Only look for the bundled templates when a working copy is missing.
+    if not time_log_path.exists():
+        time_log_template = resource_path("resources/time_log_template.xlsx")
+        if time_log_template.exists():
+            shutil.copy2(time_log_template, time_log_path)
 
-    if expenses_template.exists() and not expenses_path.exists():
-        shutil.copy2(expenses_template, expenses_path)
+    if not expenses_path.exists():
+        expenses_template = resource_path("resources/Expenses.xlsx")
+        if expenses_template.exists():
+            shutil.copy2(expenses_template, expenses_path)
 
     return {
         "appdata_dir": appdata_dir,
@@ -3,8 +3,10 @@ from __future__ import annotations
 import json
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
 
 from .tagging import Suggestion
 
@@ -15,7 +17,52 @@ class OllamaStatus:
     models: List[str]
 
 
-def detect_ollama() -> OllamaStatus:
+# `ollama list` is a subprocess; installs and pulled models change rarely.
+OLLAMA_PROBE_TTL_SECONDS = 3600
+OLLAMA_PROBE_CACHE = ".ollama-probe.json"
+_probe_cache: Optional[Tuple[float, OllamaStatus]] = None
+
+
+def detect_ollama(cache_path: Optional[Path] = None) -> OllamaStatus:
+    """Return the Ollama install status, probing at most once per TTL.
+
+    When ``cache_path`` is given, the probe result is also persisted there so a
+    fresh process can skip the subprocess while the file is younger than the TTL.
+    """
+    global _probe_cache
+    now = time.time()
+    if _probe_cache is not None and now - _probe_cache[0] < OLLAMA_PROBE_TTL_SECONDS:
+        return _probe_cache[1]
+    if cache_path is not None:
+        cached = _read_probe_cache(cache_path, now)
+        if cached is not None:
+            _probe_cache = cached
+            return cached[1]
+    status = _probe_ollama()
+    _probe_cache = (now, status)
+    if cache_path is not None:
+        try:
+            cache_path.write_text(
+                json.dumps({"probed_at": now, "installed": status.installed, "models": status.models}),
+                encoding="utf-8",
+            )
+        except OSError:
+            pass
+    return status
+
+
+def _read_probe_cache(cache_path: Path, now: float) -> Optional[Tuple[float, OllamaStatus]]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        probed_at = float(data["probed_at"])
+        if not 0 <= now - probed_at < OLLAMA_PROBE_TTL_SECONDS:
+            return None
+        return probed_at, OllamaStatus(installed=bool(data["installed"]), models=[str(m) for m in data["models"]])
+    except Exception:
+        return None
+
+
+def _probe_ollama() -> OllamaStatus:
     exe = shutil.which("ollama")
     if not exe:
         return OllamaStatus(installed=False, models=[])
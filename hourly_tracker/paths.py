@@ -7,6 +7,9 @@ APP_NAME = "HourlyTracker"
 PROFILE_ENV_VAR = "HOURLYTRACKER_PROFILE"
 _TEST_TOKEN = "TEST"
 _DOCS_FOLDER = "Documents"
+# Concrete class Path() instantiates (WindowsPath/PosixPath). An exact type check
+# against it is cheaper than isinstance() on hot path-coercion loops.
+PATH_TYPE = type(Path())
 
 
 def is_test_profile() -> bool:
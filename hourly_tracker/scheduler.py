@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import threading
-import time
 from dataclasses import dataclass
 from datetime import date, datetime, time as dt_time, timedelta
 from enum import Enum
@@ -92,6 +91,8 @@ class Scheduler:
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._run_loop, name="hourly-tracker-scheduler", daemon=True)
         self._lock = threading.Lock()
+        # (raw reflection_time_local, parsed time); re-parsed only when the setting changes.
+        self._reflection_target: Optional[tuple[str, dt_time]] = None
 
         self.state = self.state_store.load()
 
@@ -114,19 +115,18 @@ class Scheduler:
 
     def _run_loop(self) -> None:
         # On startup, make sure workbook scheduling uses persisted state.
+        # Idle ticks are pure in-memory comparisons; disk I/O only happens inside
+        # the callbacks, i.e. when something is actually due.
         while not self._stop_event.is_set():
             now = datetime.now()
             action = compute_scheduler_action(self.state, self.cfg, now)
-            if action.action == ActionType.PROMPT and self.mode != SchedulerMode.PROMPTING:
+            if action.action != ActionType.NONE and self.mode != SchedulerMode.PROMPTING:
                 self._set_mode(SchedulerMode.PROMPTING)
                 try:
-                    self.on_prompt()
-                finally:
-                    self._set_mode(SchedulerMode.RUNNING)
-            elif action.action == ActionType.CATCH_UP and self.mode != SchedulerMode.PROMPTING:
-                self._set_mode(SchedulerMode.PROMPTING)
-                try:
-                    self.on_catch_up(action.hours_missed)
+                    if action.action == ActionType.PROMPT:
+                        self.on_prompt()
+                    else:
+                        self.on_catch_up(action.hours_missed)
                 finally:
                     self._set_mode(SchedulerMode.RUNNING)
 
@@ -139,7 +139,7 @@ class Scheduler:
                     finally:
                         self._set_mode(SchedulerMode.RUNNING)
 
-            time.sleep(self.tick_seconds)
+            self._stop_event.wait(self.tick_seconds)
 
     def mark_prompted(self, when: Optional[datetime] = None) -> None:
         now = when or datetime.now()
@@ -183,11 +183,17 @@ class Scheduler:
         if not getattr(self.cfg, "reflection_enabled", True):
             return None
 
-        try:
-            hh, mm = str(self.cfg.reflection_time_local).split(":")
-            target_time = dt_time(hour=int(hh), minute=int(mm))
-        except Exception:
-            target_time = dt_time(hour=23, minute=30)
+        raw = str(self.cfg.reflection_time_local)
+        cached = self._reflection_target
+        if cached is not None and cached[0] == raw:
+            target_time = cached[1]
+        else:
+            try:
+                hh, mm = raw.split(":")
+                target_time = dt_time(hour=int(hh), minute=int(mm))
+            except Exception:
+                target_time = dt_time(hour=23, minute=30)
+            self._reflection_target = (raw, target_time)
 
         last_done = self.state.last_reflection_date
 
@@ -43,6 +43,7 @@ class AnalyticsBadRowTests(unittest.TestCase):
         # Should not raise even with malformed rows.
         report_path, _, _ = write_analytics(cfg)
         self.assertTrue(report_path.exists())
+        self.assertTrue((data / "analytics.xlsx").exists())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List, Optional
+from unittest import mock
+
+from openpyxl import Workbook, load_workbook
+
+from hourly_tracker import analytics
+from hourly_tracker.app import Config
+
+
+class AnalyticsSummaryCacheTests(unittest.TestCase):
+    def _make_cfg(self, base: Path, rows: Optional[List[list]] = None) -> Config:
+        state = base / "state"
+        data = base / "data"
+        state.mkdir(parents=True, exist_ok=True)
+        data.mkdir(parents=True, exist_ok=True)
+
+        log_path = data / "time_log.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Entries"
+        ws.append(["id", "timestamp", "activity", "notes", "category", "energy", "focus", "prompt_type", "start_time", "end_time", "created_at"])
+        if rows is None:
+            rows = [
+                ["1", "2026-01-01T10:00:00", "Email", "", "Admin", 3, 3, "regular", "", "", ""],
+                ["2", "2026-01-01T11:00:00", "Coding", "", "Work", 4, 4, "regular", "", "", ""],
+                ["3", "2026-01-02T09:00:00", "Reading", "", "Study", 2, 5, "regular", "", "", ""],
+            ]
+        for row in rows:
+            ws.append(row)
+        wb.save(log_path)
+
+        cfg = Config()
+        cfg.state_dir = state
+        cfg.data_dir = data
+        cfg.log_path = log_path
+        cfg.report_path = data / "report.html"
+        cfg.log_lock_path = state / "time_log.lock"
+        cfg.resolve_paths()
+        return cfg
+
+    def test_unchanged_days_reuse_cached_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = self._make_cfg(Path(tmp))
+            analytics.write_analytics(cfg)
+            first_report = cfg.report_path.read_text(encoding="utf-8")
+            self.assertTrue((cfg.state_dir / analytics.ANALYTICS_CACHE).exists())
+
+            with mock.patch.object(analytics, "_heuristic_narrative", wraps=analytics._heuristic_narrative) as narrative:
+                analytics.write_analytics(cfg)
+            self.assertEqual(narrative.call_count, 0)
+            second_report = cfg.report_path.read_text(encoding="utf-8")
+            self.assertEqual(first_report.split("</p>", 1)[1], second_report.split("</p>", 1)[1])
+
+    def test_failed_llm_summary_is_retried_next_run(self) -> None:
+        # Four mixed-category check-ins on one day: enough for both the daily and the weekly LLM summary.
+        rows = [
+            [str(i), f"2026-01-01T{9 + i}:00:00", act, "", cat, 3, 3, "regular", "", "", ""]
+            for i, (act, cat) in enumerate([("Email", "Admin"), ("Coding", "Work"), ("Reading", "Study"), ("Review", "Work")], start=1)
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = self._make_cfg(Path(tmp), rows)
+            llm_result = {"narrative": "LLM narrative text", "suggestions": ["a", "b", "c"]}
+            with mock.patch.object(analytics, "_llm_ready", return_value=True):
+                with mock.patch.object(analytics, "ollama_narrative_summary", return_value=None) as failing:
+                    analytics.write_analytics(cfg)
+                self.assertEqual(failing.call_count, 2)
+
+                with mock.patch.object(analytics, "ollama_narrative_summary", return_value=llm_result) as healthy:
+                    analytics.write_analytics(cfg)
+                self.assertEqual(healthy.call_count, 2)
+                self.assertIn("LLM narrative text", cfg.report_path.read_text(encoding="utf-8"))
+
+                with mock.patch.object(analytics, "ollama_narrative_summary", return_value=llm_result) as cached:
+                    analytics.write_analytics(cfg)
+                self.assertEqual(cached.call_count, 0)
+
+    def test_legacy_summary_sheets_removed_from_log(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = self._make_cfg(Path(tmp))
+            wb = load_workbook(cfg.log_path)
+            wb.create_sheet(analytics.DAILY_SHEET).append(["date", "total_hours"])
+            wb.save(cfg.log_path)
+
+            analytics.write_analytics(cfg)
+            self.assertNotIn(analytics.DAILY_SHEET, load_workbook(cfg.log_path).sheetnames)
+            self.assertIn(analytics.DAILY_SHEET, load_workbook(cfg.data_dir / analytics.ANALYTICS_WORKBOOK).sheetnames)
+            self.assertTrue((cfg.state_dir / analytics.LEGACY_SHEETS_MARKER).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from hourly_tracker.excel_store import TASK_EVENTS_COLUMNS, TASKS_COLUMNS, log_task_events_bulk, read_task_events, read_tasks
+
+
+class TaskEventsBulkTests(unittest.TestCase):
+    def test_bulk_events_update_first_matching_task_row(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            log_path = base / "time_log.xlsx"
+            lock_path = base / "time_log.lock"
+
+            wb = Workbook()
+            wb.active.title = "Entries"
+            ws_tasks = wb.create_sheet("Tasks")
+            ws_tasks.append(TASKS_COLUMNS)
+            ws_tasks.append(["task_a", "Write report", "open", "2026-01-01T09:00:00", "", "", 10, ""])
+            ws_tasks.append(["task_b", "File taxes", "open", "2026-01-01T09:00:00", "", "", 0, ""])
+            ws_tasks.append(["task_a", "Duplicate id", "open", "2026-01-01T09:00:00", "", "", 99, ""])  # duplicated task id
+            wb.create_sheet("Task_Events").append(TASK_EVENTS_COLUMNS)
+            wb.save(log_path)
+
+            log_task_events_bulk(
+                log_path,
+                [
+                    {"task_id": "task_a", "action": "worked", "minutes": 30, "effort": 3, "could_be_faster": False},
+                    {"task_id": "task_a", "action": "worked", "minutes": 15, "effort": 4, "could_be_faster": True, "notes": "second pass"},
+                    {"task_id": "task_b", "action": "worked", "minutes": 5, "effort": 2, "could_be_faster": False},
+                    {"task_id": "task_b", "action": "completed", "minutes": 0, "effort": 2, "could_be_faster": False},
+                ],
+                lock_path=lock_path,
+            )
+
+            first_a, task_b, dup_a = read_tasks(log_path, status_filter=None, lock_path=lock_path)
+            self.assertEqual(first_a["total_minutes"], 55)
+            self.assertTrue(first_a["last_worked_at"])
+            self.assertEqual(first_a["status"], "open")
+            self.assertFalse(first_a["completed_at"])
+
+            self.assertEqual(task_b["total_minutes"], 5)
+            self.assertEqual(task_b["status"], "done")
+            self.assertTrue(task_b["completed_at"])
+
+            # Only the first row with a duplicated id is updated.
+            self.assertEqual(dup_a["title"], "Duplicate id")
+            self.assertEqual(dup_a["total_minutes"], 99)
+            self.assertFalse(dup_a["last_worked_at"])
+
+            events = read_task_events(log_path, lock_path=lock_path)
+            self.assertEqual([e["task_id"] for e in events], ["task_a", "task_a", "task_b", "task_b"])
+            self.assertEqual(len({e["id"] for e in events}), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()